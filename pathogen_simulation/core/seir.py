@@ -0,0 +1,186 @@
+# SEIR epidemiological calculations
+# Pure numerics (NumPy, optionally Numba) so the model can run outside Streamlit
+import numpy as np
+from collections import namedtuple
+from data.disease_params import PathogenParams
+
+try:
+    from numba import njit
+except ImportError:  # Fall back to plain Python when numba is unavailable
+    njit = lambda **k: (lambda f: f)
+
+# Initial population parameters
+_N = 100000   # Total population
+_I0 = 100     # Initial infected
+_E0 = 200     # Initial exposed
+_R0 = 0       # Initial recovered
+_D0 = 0       # Initial deceased
+_INITIAL_STATE = (_N, _N - _I0 - _E0 - _R0 - _D0, _E0, _I0, _R0, _D0)
+
+# Daily SEIR trajectory as raw arrays
+SEIRResult = namedtuple('SEIRResult', 'day S E I R D')
+
+@njit(cache=True, fastmath=True)
+def _seir_derivatives(S, E, I, beta_over_N, sigma, gamma, mu, recover_frac):
+    """Daily rates of change of the S, E, I, R, D compartments"""
+    new_exposed = beta_over_N * S * I
+    new_infected = sigma * E
+    leaving_infected = gamma * I  # Split between recovery and death
+    return (
+        -new_exposed,
+        new_exposed - new_infected,
+        new_infected - leaving_infected,
+        leaving_infected * recover_frac,
+        leaving_infected * mu
+    )
+
+@njit(cache=True, fastmath=True)
+def _seir_core(beta, sigma, gamma, mu, N, S0, E0, I0, R0, D0, num_days):
+    """Integrate the SEIR equations with classical RK4 one day at a time"""
+    # Hoist per-step constants out of the loop; float32 literals keep numba
+    # from promoting the arithmetic to float64
+    one = np.float32(1.0)
+    two = np.float32(2.0)
+    beta_over_N = beta / N
+    recover_frac = one - mu
+    dt = np.float32(1.0)
+    half_dt = np.float32(0.5)
+    sixth_dt = np.float32(1.0 / 6.0)
+    
+    # Initialize arrays to store values
+    S = np.empty(num_days, dtype=np.float32)
+    E = np.empty(num_days, dtype=np.float32)
+    I = np.empty(num_days, dtype=np.float32)
+    R = np.empty(num_days, dtype=np.float32)
+    D = np.empty(num_days, dtype=np.float32)
+    
+    # Set initial values
+    S[0] = S_prev = S0
+    E[0] = E_prev = E0
+    I[0] = I_prev = I0
+    R[0] = R_prev = R0
+    D[0] = D_prev = D0
+    
+    # Calculate progression, carrying the previous day's state in locals
+    for t in range(1, num_days):
+        dS1, dE1, dI1, dR1, dD1 = _seir_derivatives(
+            S_prev, E_prev, I_prev, beta_over_N, sigma, gamma, mu, recover_frac
+        )
+        dS2, dE2, dI2, dR2, dD2 = _seir_derivatives(
+            S_prev + half_dt * dS1, E_prev + half_dt * dE1, I_prev + half_dt * dI1,
+            beta_over_N, sigma, gamma, mu, recover_frac
+        )
+        dS3, dE3, dI3, dR3, dD3 = _seir_derivatives(
+            S_prev + half_dt * dS2, E_prev + half_dt * dE2, I_prev + half_dt * dI2,
+            beta_over_N, sigma, gamma, mu, recover_frac
+        )
+        dS4, dE4, dI4, dR4, dD4 = _seir_derivatives(
+            S_prev + dt * dS3, E_prev + dt * dE3, I_prev + dt * dI3,
+            beta_over_N, sigma, gamma, mu, recover_frac
+        )
+        
+        S[t] = S_prev = S_prev + sixth_dt * (dS1 + two * dS2 + two * dS3 + dS4)
+        E[t] = E_prev = E_prev + sixth_dt * (dE1 + two * dE2 + two * dE3 + dE4)
+        I[t] = I_prev = I_prev + sixth_dt * (dI1 + two * dI2 + two * dI3 + dI4)
+        R[t] = R_prev = R_prev + sixth_dt * (dR1 + two * dR2 + two * dR3 + dR4)
+        D[t] = D_prev = D_prev + sixth_dt * (dD1 + two * dD2 + two * dD3 + dD4)
+    
+    return S, E, I, R, D
+
+def _seir_no_transmission(sigma, gamma, mu, S0, E0, I0, R0, D0, num_days):
+    """Exact solution of the SEIR equations when nobody new is exposed"""
+    t = np.arange(num_days, dtype=np.float64)
+    decay_E = np.exp(-sigma * t)
+    decay_I = np.exp(-gamma * t)
+    
+    E = E0 * decay_E
+    if sigma == gamma:
+        I = (I0 + sigma * E0 * t) * decay_I
+        # Integral of I from day 0 to t
+        infected_days = I0 * (1 - decay_I) / gamma + sigma * E0 * (1 - decay_I * (1 + gamma * t)) / gamma ** 2
+    else:
+        I = I0 * decay_I + sigma * E0 * (decay_E - decay_I) / (gamma - sigma)
+        infected_days = I0 * (1 - decay_I) / gamma + sigma * E0 / (gamma - sigma) * (
+            (1 - decay_E) / sigma - (1 - decay_I) / gamma
+        )
+    
+    S = np.full(num_days, S0, dtype=np.float32)
+    R = R0 + gamma * (1 - mu) * infected_days
+    D = D0 + gamma * mu * infected_days
+    
+    return S, E.astype(np.float32), I.astype(np.float32), R.astype(np.float32), D.astype(np.float32)
+
+def calculate_infection_progression(params: PathogenParams, num_days: int = 100):
+    """
+    Calculate SEIR model progression based on input parameters
+    """
+    N, S0, E0, I0, R0, D0 = _INITIAL_STATE
+    
+    # Convert rates to daily probabilities
+    beta = params.transmission_rate / 100  # Transmission rate
+    sigma = 1 / params.incubation_period   # Rate of exposed becoming infected
+    gamma = 1 / params.infectious_period    # Recovery rate
+    mu = params.mortality_rate / 100        # Mortality rate
+    
+    if beta == 0:
+        # Without transmission the system is linear and needs no time loop
+        S, E, I, R, D = _seir_no_transmission(sigma, gamma, mu, S0, E0, I0, R0, D0, num_days)
+    else:
+        S, E, I, R, D = _seir_core(
+            np.float32(beta), np.float32(sigma), np.float32(gamma), np.float32(mu), np.float32(N),
+            np.float32(S0), np.float32(E0), np.float32(I0), np.float32(R0), np.float32(D0), int(num_days)
+        )
+    
+    return SEIRResult(np.arange(num_days), S, E, I, R, D)
+
+def calculate_infection_progression_batch(beta, sigma, gamma, mu, num_days: int = 100):
+    """
+    Calculate SEIR progressions for several parameter sets at once
+    
+    Each rate is an array of shape (V,); the returned compartments have
+    shape (num_days, V) with one column per parameter set.
+    """
+    N, S0, E0, I0, R0, D0 = _INITIAL_STATE
+    # Copy the broadcast views so numba receives ordinary writeable arrays
+    beta, sigma, gamma, mu = (np.array(x) for x in np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float32) for x in (beta, sigma, gamma, mu))
+    ))
+    num_sets = beta.shape[0]
+    
+    # Hoist per-step constants out of the loop
+    beta_over_N = beta / N
+    recover_frac = 1 - mu
+    
+    S = np.empty((num_days, num_sets), dtype=np.float32)
+    E = np.empty((num_days, num_sets), dtype=np.float32)
+    I = np.empty((num_days, num_sets), dtype=np.float32)
+    R = np.empty((num_days, num_sets), dtype=np.float32)
+    D = np.empty((num_days, num_sets), dtype=np.float32)
+    S[0], E[0], I[0], R[0], D[0] = S0, E0, I0, R0, D0
+    
+    # Advance every parameter set together with the same RK4 step as _seir_core
+    for t in range(1, num_days):
+        S_prev, E_prev, I_prev = S[t - 1], E[t - 1], I[t - 1]
+        dS1, dE1, dI1, dR1, dD1 = _seir_derivatives(
+            S_prev, E_prev, I_prev, beta_over_N, sigma, gamma, mu, recover_frac
+        )
+        dS2, dE2, dI2, dR2, dD2 = _seir_derivatives(
+            S_prev + 0.5 * dS1, E_prev + 0.5 * dE1, I_prev + 0.5 * dI1,
+            beta_over_N, sigma, gamma, mu, recover_frac
+        )
+        dS3, dE3, dI3, dR3, dD3 = _seir_derivatives(
+            S_prev + 0.5 * dS2, E_prev + 0.5 * dE2, I_prev + 0.5 * dI2,
+            beta_over_N, sigma, gamma, mu, recover_frac
+        )
+        dS4, dE4, dI4, dR4, dD4 = _seir_derivatives(
+            S_prev + dS3, E_prev + dE3, I_prev + dI3,
+            beta_over_N, sigma, gamma, mu, recover_frac
+        )
+        
+        S[t] = S_prev + (dS1 + 2 * dS2 + 2 * dS3 + dS4) / 6
+        E[t] = E_prev + (dE1 + 2 * dE2 + 2 * dE3 + dE4) / 6
+        I[t] = I_prev + (dI1 + 2 * dI2 + 2 * dI3 + dI4) / 6
+        R[t] = R[t - 1] + (dR1 + 2 * dR2 + 2 * dR3 + dR4) / 6
+        D[t] = D[t - 1] + (dD1 + 2 * dD2 + 2 * dD3 + dD4) / 6
+    
+    return SEIRResult(np.arange(num_days), S, E, I, R, D)
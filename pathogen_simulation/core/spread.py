@@ -0,0 +1,51 @@
+# Global spread calculations
+# Row-parallel kernel for large country tables (NumPy, optionally Numba)
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Fall back to plain Python when numba is unavailable
+    njit = lambda **k: (lambda f: f)
+    prange = range
+    HAVE_NUMBA = False
+
+@njit(parallel=True, fastmath=True, cache=True)
+def spread_kernel(pop_density, air_quality, water_quality, health_conditions, population,
+                  maxes, coeffs, transmission_factor, variant_impact):
+    """
+    Compute risk score, infection rate, active cases, per-variant cases and
+    severity index for every country in one pass over the rows
+    
+    maxes holds the column maxima of the four risk inputs; coeffs holds each
+    variant's (daily_cases/1000) * (severity/10).
+    """
+    n = population.shape[0]
+    risk = np.empty(n, dtype=np.float32)
+    infection = np.empty(n, dtype=np.float32)
+    active_cases = np.empty(n, dtype=np.int64)
+    variant_cases = np.empty((n, coeffs.shape[0]), dtype=np.int64)
+    severity = np.empty(n, dtype=np.float32)
+    
+    for i in prange(n):
+        r = (
+            0.3 * pop_density[i] / maxes[0] +
+            0.2 * air_quality[i] / maxes[1] +
+            0.2 * water_quality[i] / maxes[2] +
+            0.3 * health_conditions[i] / maxes[3]
+        )
+        r = min(max(r, 0.0), 1.0)
+        rate = min(max(r * transmission_factor, 0.0), 1.0)
+        cases = population[i] * rate
+        
+        risk[i] = r
+        infection[i] = rate
+        active_cases[i] = np.int64(cases)
+        for j in range(coeffs.shape[0]):
+            variant_cases[i, j] = np.int64(cases * coeffs[j])
+        
+        base = 0.4 * pop_density[i] / maxes[0] + 0.3 * health_conditions[i] / 100 + 0.3 * rate
+        base = min(max(base, 0.0), 1.0)
+        severity[i] = min(max(base * (1 + variant_impact), 0.0), 1.0) * 10
+    
+    return risk, infection, active_cases, variant_cases, severity
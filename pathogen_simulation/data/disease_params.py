@@ -1 +1,13 @@
 # Disease parameters handling
+from typing import NamedTuple
+
+class PathogenParams(NamedTuple):
+    """Pathogen characteristics chosen in the sidebar"""
+    type: str = 'Virus'
+    transmission_route: str = 'Airborne'
+    transmission_rate: float = 50.0
+    incubation_period: int = 5
+    infectious_period: int = 14
+    recovery_rate: float = 95.0
+    mortality_rate: float = 2.0
+    mutation_rate: float = 0.1
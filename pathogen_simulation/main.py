@@ -1,85 +1,75 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from typing import Dict, Any
-import time
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from typing import Dict
 
-# Import visualization components
-from visualizations.infection_progress import display_infection_progress
-from visualizations.world_heatmap import display_global_map
-from visualizations.healthcare_load import display_healthcare_load
-from visualizations.variant_analysis import display_variant_tracking
+# Import visualization components (the data-heavy pages are imported
+# lazily in main() so the Home page doesn't pay for pandas/Plotly)
 from visualizations.home import display_home_page
-from src.data_handler import CountryDataHandler
+from data.disease_params import PathogenParams
+
+# Parameter sections shown in the sidebar for each page
+_REQUIRED_SECTIONS: Dict[str, tuple] = {
+    "Home": (),
+    "Infection Progression": ("pathogen",),
+    "Global Spread Map": ("pathogen", "variants"),
+    "Healthcare System Load": ("pathogen", "healthcare", "vaccination"),
+    "Variant Tracking": ("pathogen", "variants")
+}
 
 def initialize_session_state():
     """Initialize all parameter values in session state"""
-    # Initialize show_visualization
-    if 'show_visualization' not in st.session_state:
-        st.session_state.show_visualization = True  # True by default for Home page
+    # Initialize show_visualization (True by default for Home page)
+    st.session_state.setdefault('show_visualization', True)
     
     # Reset show_visualization when changing from Home to other pages
-    if 'previous_page' not in st.session_state:
-        st.session_state.previous_page = "Home"
-    
+    previous_page = st.session_state.setdefault('previous_page', "Home")
     current_page = st.session_state.get('nav_page', "Home")  # Get current page
-    if st.session_state.previous_page == "Home" and current_page != "Home":
+    if previous_page == "Home" and current_page != "Home":
         st.session_state.show_visualization = False
     st.session_state.previous_page = current_page
     
-    if 'pathogen_params' not in st.session_state:
-        st.session_state.pathogen_params = {
-            'type': 'Virus',
-            'transmission_route': 'Airborne',
-            'transmission_rate': 50.0,
-            'incubation_period': 5,
-            'infectious_period': 14,
-            'recovery_rate': 95.0,
-            'mortality_rate': 2.0,
-            'mutation_rate': 0.1
-        }
+    st.session_state.setdefault('pathogen_params', PathogenParams())
     
-    if 'variants' not in st.session_state:
-        st.session_state.variants = []
-        
-    if 'healthcare_params' not in st.session_state:
-        st.session_state.healthcare_params = {
-            'hospital_beds': 20.0,
-            'icu_beds': 5.0,
-            'ventilators': 2.0,
-            'transmission_rate': 5.0,
-            'research_labs': 1.0,
-            'reporting_systems': 10.0,
-            'diagnostic_centers': 3.0,
-            'healthcare_workers': 25.0,
-            'epidemiologists': 2.0,
-            'ppe_kits': 50.0,
-            'medicine_stock': 1000.0,
-            'healthcare_budget': 5000.0,
-            'daily_tests': 100.0,
-            'testing_accuracy': 95.0,
-            'daily_vaccinations': 100.0
-        }
+    st.session_state.setdefault('variants', [])
+    # Name indexes for O(1) duplicate checks on add
+    st.session_state.setdefault('variant_names', set())
+    st.session_state.setdefault('vaccine_names', set())
     
-    if 'vaccination_params' not in st.session_state:
-        st.session_state.vaccination_params = {
-            'vaccines': []
-        }
+    st.session_state.setdefault('healthcare_params', {
+        'hospital_beds': 20.0,
+        'icu_beds': 5.0,
+        'ventilators': 2.0,
+        'transmission_rate': 5.0,
+        'research_labs': 1.0,
+        'reporting_systems': 10.0,
+        'diagnostic_centers': 3.0,
+        'healthcare_workers': 25.0,
+        'epidemiologists': 2.0,
+        'ppe_kits': 50.0,
+        'medicine_stock': 1000.0,
+        'healthcare_budget': 5000.0,
+        'daily_tests': 100.0,
+        'testing_accuracy': 95.0,
+        'daily_vaccinations': 100.0
+    })
+    
+    # Vaccines are stored column-wise: one list per field, indexed by vaccine
+    st.session_state.setdefault('vaccination_params', {
+        'name': [],
+        'population_vaccinated': [],
+        'effectiveness': [],
+        'waning_immunity_rate': []
+    })
 
     # Initialize vaccine-related session state variables
-    if 'vaccine_to_remove' not in st.session_state:
-        st.session_state.vaccine_to_remove = None
-        
-    if 'pending_vaccine' not in st.session_state:
-        st.session_state.pending_vaccine = None
-        
-    if 'temp_vaccines' not in st.session_state:
-        st.session_state.temp_vaccines = []
+    st.session_state.setdefault('vaccine_to_remove', None)
+    st.session_state.setdefault('pending_vaccine', None)
 
-    if 'show_visualization' not in st.session_state:
-        st.session_state.show_visualization = False
+def initialize_country_data():
+    """Share one data handler and country DataFrame across all pages"""
+    if 'country_handler' not in st.session_state:
+        from src.data_handler import CountryDataHandler
+        st.session_state.country_handler = CountryDataHandler()
+        st.session_state.country_df = st.session_state.country_handler.load_country_data()
 
 def main():
     # Set page config
@@ -107,32 +97,31 @@ def main():
     if page == "Home":
         display_home_page()
     else:
+        initialize_country_data()
+        
         # Parameter inputs in sidebar below navigation
         display_parameter_inputs(page)
         
         # Show visualizations only if parameters have been updated
         if st.session_state.show_visualization:
             if page == "Infection Progression":
+                from visualizations.infection_progress import display_infection_progress
                 display_infection_progress()
             elif page == "Global Spread Map":
+                from visualizations.world_heatmap import display_global_map
                 display_global_map()
             elif page == "Healthcare System Load":
+                from visualizations.healthcare_load import display_healthcare_load
                 display_healthcare_load()
             elif page == "Variant Tracking":
+                from visualizations.variant_analysis import display_variant_tracking
                 display_variant_tracking()
         else:
             st.info("👈 Adjust parameters in the sidebar and click 'Update Visualization' to see the simulation results.")
 
-def get_required_sections(page: str) -> list:
-    """Return list of required parameter sections based on selected page"""
-    sections = {
-        "Home": [],
-        "Infection Progression": ["pathogen"],
-        "Global Spread Map": ["pathogen", "variants"],
-        "Healthcare System Load": ["pathogen", "healthcare", "vaccination"],
-        "Variant Tracking": ["pathogen", "variants"]
-    }
-    return sections.get(page, [])
+def get_required_sections(page: str) -> tuple:
+    """Return the required parameter sections based on selected page"""
+    return _REQUIRED_SECTIONS.get(page, ())
 
 def display_parameter_inputs(page: str):
     """Display parameter inputs based on selected visualization"""
@@ -165,17 +154,18 @@ def display_parameter_inputs(page: str):
         # Submit button at the bottom
         st.form_submit_button("Update Visualization")
 
-def display_pathogen_params() -> Dict[str, Any]:
-    """Display pathogen characteristic inputs"""
+def display_pathogen_params() -> PathogenParams:
+    """Display pathogen characteristic inputs and return the updated parameters"""
+    new_params = {}
     with st.expander("Basic Pathogen Parameters", expanded=False):
-        st.session_state.pathogen_params['type'] = st.selectbox(
+        new_params['type'] = st.selectbox(
             "Type of Pathogen",
             options=['Virus', 'Bacteria', 'Fungi', 'Parasite'],
             help="Select the type of infectious agent"
         )
         
         # Rest of your parameter inputs remain the same
-        st.session_state.pathogen_params['transmission_route'] = st.selectbox(
+        new_params['transmission_route'] = st.selectbox(
             "Route of Transmission",
             options=['Airborne', 'Droplet', 'Contact', 'Vector-borne', 'Food-borne', 'Water-borne'],
             help="How the pathogen spreads between hosts"
@@ -184,53 +174,55 @@ def display_pathogen_params() -> Dict[str, Any]:
         col1, col2 = st.columns(2)
         
         with col1:
-            st.session_state.pathogen_params['transmission_rate'] = st.number_input(
+            new_params['transmission_rate'] = st.number_input(
                 "Transmission Rate (%)",
                 min_value=0.0,
                 max_value=100.0,
-                value=st.session_state.pathogen_params['transmission_rate'],
+                value=st.session_state.pathogen_params.transmission_rate,
                 step=0.1
             )
             
-            st.session_state.pathogen_params['incubation_period'] = st.number_input(
+            new_params['incubation_period'] = st.number_input(
                 "Incubation Period (days)",
                 min_value=0,
                 max_value=60,
-                value=st.session_state.pathogen_params['incubation_period']
+                value=st.session_state.pathogen_params.incubation_period
             )
             
-            st.session_state.pathogen_params['infectious_period'] = st.number_input(
+            new_params['infectious_period'] = st.number_input(
                 "Infectious Period (days)",
                 min_value=0,
                 max_value=60,
-                value=st.session_state.pathogen_params['infectious_period']
+                value=st.session_state.pathogen_params.infectious_period
             )
             
         with col2:
-            st.session_state.pathogen_params['recovery_rate'] = st.number_input(
+            new_params['recovery_rate'] = st.number_input(
                 "Recovery Rate (%)",
                 min_value=0.0,
                 max_value=100.0,
-                value=st.session_state.pathogen_params['recovery_rate'],
+                value=st.session_state.pathogen_params.recovery_rate,
                 step=0.1
             )
             
-            st.session_state.pathogen_params['mortality_rate'] = st.number_input(
+            new_params['mortality_rate'] = st.number_input(
                 "Mortality Rate (%)",
                 min_value=0.0,
                 max_value=100.0,
-                value=st.session_state.pathogen_params['mortality_rate'],
+                value=st.session_state.pathogen_params.mortality_rate,
                 step=0.1
             )
             
-            st.session_state.pathogen_params['mutation_rate'] = st.number_input(
+            new_params['mutation_rate'] = st.number_input(
                 "Mutation Rate (%)",
                 min_value=0.0,
                 max_value=100.0,
-                value=st.session_state.pathogen_params['mutation_rate'],
+                value=st.session_state.pathogen_params.mutation_rate,
                 step=0.1
             )
     
+    # Write all values back in a single update
+    st.session_state.pathogen_params = st.session_state.pathogen_params._replace(**new_params)
     return st.session_state.pathogen_params
 
 def display_variant_params():
@@ -252,16 +244,20 @@ def display_variant_params():
                 'recovery_rate': st.number_input("Recovery Rate (%)", 0.0, 100.0, step=0.1),
                 'vaccine_effectiveness': st.number_input("Vaccine Effectiveness (%)", 0.0, 100.0, step=0.1)
             }
-            if not any(v['name'] == variant['name'] for v in st.session_state.variants):
+            if variant['name'] not in st.session_state.variant_names:
+                # Name the variant's case column once instead of on every render
+                variant['_cases_col'] = f"{variant['name']}_cases"
                 st.session_state.variants.append(variant)
+                st.session_state.variant_names.add(variant['name'])
 
 def display_healthcare_params():
     """Display healthcare system parameters"""
+    new_params = {}
     with st.expander("Healthcare System Parameters", expanded=False):
         col1, col2 = st.columns(2)
         
         with col1:
-            st.session_state.healthcare_params['hospital_beds'] = st.number_input(
+            new_params['hospital_beds'] = st.number_input(
                 "Hospital Beds (per 10,000)",
                 min_value=0.0,
                 max_value=10000.0,
@@ -269,7 +265,7 @@ def display_healthcare_params():
                 step=0.1
             )
             
-            st.session_state.healthcare_params['icu_beds'] = st.number_input(
+            new_params['icu_beds'] = st.number_input(
                 "ICU Beds (per 10,000)",
                 min_value=0.0,
                 max_value=10000.0,
@@ -277,7 +273,7 @@ def display_healthcare_params():
                 step=0.1
             )
             
-            st.session_state.healthcare_params['ventilators'] = st.number_input(
+            new_params['ventilators'] = st.number_input(
                 "Ventilators (per 10,000)",
                 min_value=0.0,
                 max_value=10000.0,
@@ -286,7 +282,7 @@ def display_healthcare_params():
             )
         
         with col2:
-            st.session_state.healthcare_params['healthcare_workers'] = st.number_input(
+            new_params['healthcare_workers'] = st.number_input(
                 "Healthcare Workers (per 10,000)",
                 min_value=0.0,
                 max_value=10000.0,
@@ -294,44 +290,47 @@ def display_healthcare_params():
                 step=0.1
             )
             
-            st.session_state.healthcare_params['medicine_stock'] = st.number_input(
+            new_params['medicine_stock'] = st.number_input(
                 "Medicine Stock (per 100)",
                 min_value=0.0,
                 max_value=100000.0,
                 value=float(st.session_state.healthcare_params['medicine_stock']),
                 step=0.1
             )
+    
+    # Write all values back in a single update
+    st.session_state.healthcare_params.update(new_params)
 
 def display_vaccination_params():
     """Display vaccination program parameters"""
-    if 'vaccination_params' not in st.session_state:
-        st.session_state.vaccination_params = {
-            'vaccines': []
-        }
+    vaccines = st.session_state.vaccination_params
         
     with st.sidebar.expander("Vaccination Parameters", expanded=False):
         # Show current vaccines
-        if st.session_state.vaccination_params['vaccines']:
+        if vaccines['name']:
             st.write("Current Vaccines:")
             vaccines_to_remove = []
-            for idx, vaccine in enumerate(st.session_state.vaccination_params['vaccines']):
+            for idx, name in enumerate(vaccines['name']):
                 col1, col2 = st.columns([3, 1])
                 with col1:
-                    st.write(f"**{vaccine['name']}**")
+                    st.write(f"**{name}**")
                 with col2:
                     if st.form_submit_button("Remove", key=f"remove_vaccine_{idx}"):
                         vaccines_to_remove.append(idx)
             
             # Remove vaccines (if any) after the loop
             for idx in reversed(vaccines_to_remove):
-                st.session_state.vaccination_params['vaccines'].pop(idx)
+                st.session_state.vaccine_names.discard(vaccines['name'][idx])
+                for column in vaccines.values():
+                    column.pop(idx)
+            if vaccines_to_remove:
                 st.rerun()
 
         # Add new vaccine interface
         if st.checkbox("Add New Vaccine"):
             vaccine_name = st.text_input(
                 "Vaccine Name", 
-                value=f"Vaccine {len(st.session_state.vaccination_params['vaccines']) + 1}"
+                value=f"Vaccine {len(vaccines['name']) + 1}"
             )
             population_vaccinated = st.number_input(
                 "Population Vaccinated (%)", 
@@ -363,14 +362,13 @@ def display_vaccination_params():
             }
             
             # Directly update session state
-            if not any(v['name'] == new_vaccine['name'] for v in st.session_state.vaccination_params['vaccines']):
-                if 'temp_vaccines' not in st.session_state:
-                    st.session_state.temp_vaccines = []
-                st.session_state.temp_vaccines.append(new_vaccine)
-                st.session_state.vaccination_params['vaccines'] = st.session_state.temp_vaccines
+            if new_vaccine['name'] not in st.session_state.vaccine_names:
+                for field, value in new_vaccine.items():
+                    vaccines[field].append(value)
+                st.session_state.vaccine_names.add(new_vaccine['name'])
 
         # Display total number of vaccines
-        total_vaccines = len(st.session_state.vaccination_params['vaccines'])
+        total_vaccines = len(vaccines['name'])
         st.metric(
             "Total Vaccines",
             total_vaccines,
@@ -382,8 +380,8 @@ def display_vaccination_params():
         st.write(f"Number of vaccines in system: {total_vaccines}")
         if total_vaccines > 0:
             st.write("Current vaccines:")
-            for v in st.session_state.vaccination_params['vaccines']:
-                st.write(f"- {v['name']}: {v['population_vaccinated']}% coverage")
+            for name, coverage in zip(vaccines['name'], vaccines['population_vaccinated']):
+                st.write(f"- {name}: {coverage}% coverage")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
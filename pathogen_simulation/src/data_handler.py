@@ -1,92 +1,164 @@
 # src/data_handler.py
+import functools
+import os
 import pandas as pd
 import numpy as np
+import streamlit as st
 from pathlib import Path
 
+# Top 50 countries by population
+_COUNTRIES = (
+    'China', 'India', 'United States', 'Indonesia', 'Pakistan',
+    'Brazil', 'Nigeria', 'Bangladesh', 'Russia', 'Mexico',
+    'Japan', 'Ethiopia', 'Philippines', 'Egypt', 'Vietnam',
+    'DR Congo', 'Turkey', 'Iran', 'Germany', 'Thailand',
+    'United Kingdom', 'France', 'Italy', 'South Africa', 'Tanzania',
+    'Myanmar', 'South Korea', 'Colombia', 'Kenya', 'Spain',
+    'Argentina', 'Algeria', 'Sudan', 'Uganda', 'Iraq',
+    'Poland', 'Canada', 'Morocco', 'Saudi Arabia', 'Uzbekistan',
+    'Malaysia', 'Peru', 'Afghanistan', 'Venezuela', 'Ghana',
+    'Angola', 'Nepal', 'Yemen', 'North Korea', 'Australia'
+)
+
+_CONTINENTS = {
+    'China': 'Asia', 'India': 'Asia', 'United States': 'North America',
+    'Indonesia': 'Asia', 'Pakistan': 'Asia', 'Brazil': 'South America',
+    'Nigeria': 'Africa', 'Bangladesh': 'Asia', 'Russia': 'Europe/Asia',
+    'Mexico': 'North America', 'Japan': 'Asia', 'Ethiopia': 'Africa',
+    'Philippines': 'Asia', 'Egypt': 'Africa', 'Vietnam': 'Asia',
+    'DR Congo': 'Africa', 'Turkey': 'Asia', 'Iran': 'Asia',
+    'Germany': 'Europe', 'Thailand': 'Asia', 'United Kingdom': 'Europe',
+    'France': 'Europe', 'Italy': 'Europe', 'South Africa': 'Africa',
+    'Tanzania': 'Africa', 'Myanmar': 'Asia', 'South Korea': 'Asia',
+    'Colombia': 'South America', 'Kenya': 'Africa', 'Spain': 'Europe',
+    'Argentina': 'South America', 'Algeria': 'Africa', 'Sudan': 'Africa',
+    'Uganda': 'Africa', 'Iraq': 'Asia', 'Poland': 'Europe',
+    'Canada': 'North America', 'Morocco': 'Africa', 'Saudi Arabia': 'Asia',
+    'Uzbekistan': 'Asia', 'Malaysia': 'Asia', 'Peru': 'South America',
+    'Afghanistan': 'Asia', 'Venezuela': 'South America', 'Ghana': 'Africa',
+    'Angola': 'Africa', 'Nepal': 'Asia', 'Yemen': 'Asia',
+    'North Korea': 'Asia', 'Australia': 'Oceania'
+}
+
+# Continent categories and the per-country codes into them
+_CONTINENT_CATS = pd.CategoricalDtype([
+    'Africa', 'Asia', 'Europe', 'Europe/Asia', 'North America', 'Oceania', 'South America'
+])
+_CONTINENT_CODES = np.fromiter(
+    (_CONTINENT_CATS.categories.get_loc(_CONTINENTS[c]) for c in _COUNTRIES),
+    dtype='int8',
+    count=len(_COUNTRIES)
+)
+
+# Population data (2021 estimates); int64 to match _COLUMN_DTYPES, since the
+# spread model multiplies populations into case counts
+_POPULATIONS = np.array([
+    1439323776, 1380004385, 331002651, 273523615, 220892340,
+    212559417, 206139589, 164689383, 145912025, 128932753,
+    126476461, 114963588, 109581078, 102334404, 97338579,
+    89561403, 84339067, 83992949, 83783942, 69799978,
+    67886011, 65273511, 60461826, 59308690, 59734218,
+    54409800, 51269185, 50882891, 53771296, 46754778,
+    45195774, 44616624, 43849260, 45741007, 40462701,
+    37846611, 37742154, 36910560, 34813871, 33469203,
+    32365999, 32971854, 38928346, 28435943, 31072940,
+    32866272, 29136808, 29825964, 25778816, 25499884
+], dtype='int64')
+
+# Columns every country data file must provide
+_REQUIRED_COLUMNS = frozenset({
+    'country', 'continent', 'population', 'population_density',
+    'air_quality_index', 'water_quality_index', 'age_distribution_young',
+    'age_distribution_adult', 'age_distribution_elderly',
+    'gender_ratio', 'health_conditions_percentage'
+})
+
+# Narrow dtypes for the spread model inputs; rates and indices never need float64
+_COLUMN_DTYPES = {
+    'population_density': 'float32',
+    'air_quality_index': 'float32',
+    'water_quality_index': 'float32',
+    'health_conditions_percentage': 'float32',
+    'population': 'int64'
+}
+
+def _with_column_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast whichever spread model columns the frame has to their narrow dtypes"""
+    return df.astype({column: dtype for column, dtype in _COLUMN_DTYPES.items() if column in df.columns})
+
+@functools.lru_cache(maxsize=1)
+def _build_top_50_countries():
+    """Build the top 50 countries DataFrame once per process"""
+    df = pd.DataFrame({'country': _COUNTRIES})
+    df['continent'] = pd.Categorical.from_codes(_CONTINENT_CODES, dtype=_CONTINENT_CATS)
+    df['population'] = _POPULATIONS
+    
+    # Generate semi-realistic data for other metrics in a single draw
+    rng = np.random.default_rng(42)  # For reproducibility
+    generated_columns = [
+        'population_density',            # people per sq km
+        'air_quality_index',             # 0-500, lower is better
+        'water_quality_index',           # 0-100, higher is better
+        'age_distribution_young',
+        'age_distribution_adult',
+        'gender_ratio',                  # males per 100 females
+        'health_conditions_percentage'
+    ]
+    lows = np.array([3, 30, 40, 15, 40, 95, 15])
+    highs = np.array([1300, 180, 95, 45, 65, 105, 35])
+    values = rng.random((len(df), len(generated_columns))) * (highs - lows) + lows
+    df[generated_columns] = values.round(1).astype('float32')
+    df.insert(
+        df.columns.get_loc('age_distribution_adult') + 1,
+        'age_distribution_elderly',
+        (100 - df['age_distribution_young'] - df['age_distribution_adult']).round(1)
+    )
+
+    return df.astype(_COLUMN_DTYPES)
+
 def create_top_50_countries():
     """Create comprehensive data for top 50 countries"""
-    # Create a dictionary with lists of equal length
-    data = {
-        'country': [
-            'China', 'India', 'United States', 'Indonesia', 'Pakistan', 
-            'Brazil', 'Nigeria', 'Bangladesh', 'Russia', 'Mexico',
-            'Japan', 'Ethiopia', 'Philippines', 'Egypt', 'Vietnam',
-            'DR Congo', 'Turkey', 'Iran', 'Germany', 'Thailand',
-            'United Kingdom', 'France', 'Italy', 'South Africa', 'Tanzania',
-            'Myanmar', 'South Korea', 'Colombia', 'Kenya', 'Spain',
-            'Argentina', 'Algeria', 'Sudan', 'Uganda', 'Iraq',
-            'Poland', 'Canada', 'Morocco', 'Saudi Arabia', 'Uzbekistan',
-            'Malaysia', 'Peru', 'Afghanistan', 'Venezuela', 'Ghana',
-            'Angola', 'Nepal', 'Yemen', 'North Korea', 'Australia'
-        ]
-    }
-    
-    # Create DataFrame first
-    df = pd.DataFrame(data)
-    
-    # Add continent data
-    continent_map = {
-        'China': 'Asia', 'India': 'Asia', 'United States': 'North America',
-        'Indonesia': 'Asia', 'Pakistan': 'Asia', 'Brazil': 'South America',
-        'Nigeria': 'Africa', 'Bangladesh': 'Asia', 'Russia': 'Europe/Asia',
-        'Mexico': 'North America', 'Japan': 'Asia', 'Ethiopia': 'Africa',
-        'Philippines': 'Asia', 'Egypt': 'Africa', 'Vietnam': 'Asia',
-        'DR Congo': 'Africa', 'Turkey': 'Asia', 'Iran': 'Asia',
-        'Germany': 'Europe', 'Thailand': 'Asia', 'United Kingdom': 'Europe',
-        'France': 'Europe', 'Italy': 'Europe', 'South Africa': 'Africa',
-        'Tanzania': 'Africa', 'Myanmar': 'Asia', 'South Korea': 'Asia',
-        'Colombia': 'South America', 'Kenya': 'Africa', 'Spain': 'Europe',
-        'Argentina': 'South America', 'Algeria': 'Africa', 'Sudan': 'Africa',
-        'Uganda': 'Africa', 'Iraq': 'Asia', 'Poland': 'Europe',
-        'Canada': 'North America', 'Morocco': 'Africa', 'Saudi Arabia': 'Asia',
-        'Uzbekistan': 'Asia', 'Malaysia': 'Asia', 'Peru': 'South America',
-        'Afghanistan': 'Asia', 'Venezuela': 'South America', 'Ghana': 'Africa',
-        'Angola': 'Africa', 'Nepal': 'Asia', 'Yemen': 'Asia',
-        'North Korea': 'Asia', 'Australia': 'Oceania'
+    return _build_top_50_countries().copy()
+
+@st.cache_data(show_spinner=False)
+def _load_country_df(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Parse a country data file once per path/mtime across reruns"""
+    return pd.read_parquet(path, engine='pyarrow')
+
+@st.cache_data(show_spinner=False)
+def _summarize_country_df(path: str, mtime_ns: int, _df: pd.DataFrame) -> dict:
+    """Compute country statistics once per path/mtime across reruns"""
+    means = _df[['population', 'air_quality_index', 'water_quality_index']].mean()
+    continent = _df['continent']
+    if isinstance(continent.dtype, pd.CategoricalDtype):
+        continents = continent.cat.categories.tolist()
+    else:
+        continents = continent.unique().tolist()
+    return {
+        'total_countries': len(_df),
+        'continents': continents,
+        'avg_population': means['population'],
+        'avg_air_quality': means['air_quality_index'],
+        'avg_water_quality': means['water_quality_index']
     }
-    df['continent'] = df['country'].map(continent_map)
-    
-    # Add population data (2021 estimates)
-    df['population'] = [1439323776, 1380004385, 331002651, 273523615, 220892340,
-                       212559417, 206139589, 164689383, 145912025, 128932753,
-                       126476461, 114963588, 109581078, 102334404, 97338579,
-                       89561403, 84339067, 83992949, 83783942, 69799978,
-                       67886011, 65273511, 60461826, 59308690, 59734218,
-                       54409800, 51269185, 50882891, 53771296, 46754778,
-                       45195774, 44616624, 43849260, 45741007, 40462701,
-                       37846611, 37742154, 36910560, 34813871, 33469203,
-                       32365999, 32971854, 38928346, 28435943, 31072940,
-                       32866272, 29136808, 29825964, 25778816, 25499884]
-    
-    # Generate semi-realistic data for other metrics
-    np.random.seed(42)  # For reproducibility
-    
-    # Population density (people per sq km)
-    df['population_density'] = np.random.uniform(3, 1300, len(df)).round(1)
-    
-    # Air Quality Index (0-500, lower is better)
-    df['air_quality_index'] = np.random.uniform(30, 180, len(df)).round(1)
-    
-    # Water Quality Index (0-100, higher is better)
-    df['water_quality_index'] = np.random.uniform(40, 95, len(df)).round(1)
-    
-    # Age distribution
-    df['age_distribution_young'] = np.random.uniform(15, 45, len(df)).round(1)
-    df['age_distribution_adult'] = np.random.uniform(40, 65, len(df)).round(1)
-    df['age_distribution_elderly'] = (100 - df['age_distribution_young'] - df['age_distribution_adult']).round(1)
-    
-    # Gender ratio (males per 100 females)
-    df['gender_ratio'] = np.random.uniform(95, 105, len(df)).round(1)
-    
-    # Health conditions percentage
-    df['health_conditions_percentage'] = np.random.uniform(15, 35, len(df)).round(1)
-    
-    return df
+
+@st.cache_data(show_spinner=False)
+def _statistics_for(path: str, mtime_ns: int) -> tuple:
+    """Summarize a country data file once per path/mtime across reruns"""
+    data = pd.read_parquet(path, engine='pyarrow')
+    return len(data), tuple(data.columns), tuple(data.isnull().sum().items())
 
 class CountryDataHandler:
+    # Data directories already created in this process
+    _DIRS_READY = set()
+    
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / 'data'
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        if self.data_dir not in CountryDataHandler._DIRS_READY:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            CountryDataHandler._DIRS_READY.add(self.data_dir)
+        # Parsed DataFrames keyed by filename
+        self._cache = {}
         
     def initialize_default_data(self):
         """Initialize with top 50 countries data"""
@@ -94,42 +166,80 @@ class CountryDataHandler:
         self.save_country_data(df)
         return df
     
-    def save_country_data(self, df, filename='country_data.csv'):
-        """Save country data to CSV file"""
+    def save_country_data(self, df, filename='country_data.parquet'):
+        """Save country data to Parquet file"""
         file_path = self.data_dir / filename
-        df.to_csv(file_path, index=False)
+        df = _with_column_dtypes(df)
+        df.to_parquet(file_path, index=False, engine='pyarrow', compression='snappy')
+        self._cache[filename] = df
         print(f"Data saved to {file_path}")
     
-    def load_country_data(self, filename='country_data.csv'):
-        """Load country data from CSV file"""
+    def load_country_data(self, filename='country_data.parquet'):
+        """Load country data from Parquet file"""
+        cached = self._cache.get(filename)
+        if cached is not None:
+            return cached.copy(deep=False)
+        
         file_path = self.data_dir / filename
+        legacy_path = file_path.with_suffix('.csv')
+        if not file_path.exists() and legacy_path.exists():
+            # One-time migration from the legacy CSV format
+            print("Migrating existing CSV data to Parquet...")
+            self.save_country_data(pd.read_csv(legacy_path), filename)
+        
         try:
-            df = pd.read_csv(file_path)
+            df = _load_country_df(str(file_path), file_path.stat().st_mtime_ns)
             # Verify all required columns are present
-            required_columns = ['country', 'continent', 'population', 'population_density', 
-                              'air_quality_index', 'water_quality_index', 'age_distribution_young',
-                              'age_distribution_adult', 'age_distribution_elderly', 
-                              'gender_ratio', 'health_conditions_percentage']
-            
-            if not all(col in df.columns for col in required_columns):
+            if not _REQUIRED_COLUMNS.issubset(df.columns):
                 print("Missing columns in existing data. Reinitializing...")
                 return self.initialize_default_data()
-            return df
+            # Cast once here rather than on every rerun that uses the data
+            df = _with_column_dtypes(df)
+            self._cache[filename] = df
+            return df.copy(deep=False)
         except FileNotFoundError:
             print("No existing data found. Initializing with default data...")
             return self.initialize_default_data()
         
-    def get_country_stats(self):
+    def get_country_stats(self, filename='country_data.parquet'):
         """Get basic statistics about the countries"""
-        df = self.load_country_data()
-        stats = {
-            'total_countries': len(df),
-            'continents': df['continent'].unique().tolist(),
-            'avg_population': df['population'].mean(),
-            'avg_air_quality': df['air_quality_index'].mean(),
-            'avg_water_quality': df['water_quality_index'].mean()
+        df = self.load_country_data(filename)
+        file_path = self.data_dir / filename
+        return _summarize_country_df(str(file_path), file_path.stat().st_mtime_ns, df)
+    
+    def update_country_data(self, new_data, filename='country_data.parquet'):
+        """Update existing country data"""
+        existing_data = self.load_country_data(filename)
+        if existing_data.empty:
+            self.save_country_data(new_data, filename)
+            return
+        
+        # Nothing to merge
+        if new_data.empty or existing_data.equals(new_data):
+            return
+        
+        # Rows in new_data replace existing rows for the same country
+        updated_data = pd.concat([existing_data, new_data], ignore_index=True).drop_duplicates(
+            subset=['country'], keep='last'
+        )
+        self._cache.pop(filename, None)
+        self.save_country_data(updated_data, filename)
+    
+    def get_country_statistics(self, filename='country_data.parquet'):
+        """Get basic statistics about the country data"""
+        file_path = self.data_dir / filename
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            print(f"No data file found at {file_path}")
+            return None
+        
+        total_countries, columns, missing_values = _statistics_for(str(file_path), mtime_ns)
+        return {
+            'total_countries': total_countries,
+            'columns': list(columns),
+            'missing_values': dict(missing_values)
         }
-        return stats
 
 # Test the data handler
 if __name__ == "__main__":
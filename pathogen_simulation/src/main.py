@@ -1,8 +1,46 @@
 # src/main.py
 import streamlit as st
 import plotly.express as px
+import numpy as np
+import pandas as pd
 from data_handler import CountryDataHandler
 
+# Cached figures are keyed on the data file's mtime and the continent
+# selection; the underscore-prefixed frame itself is never hashed
+@st.cache_data
+def _build_population_map(_filtered_df: pd.DataFrame, continents: tuple, data_mtime_ns: int):
+    """Build the population scatter map for the selected continents"""
+    return px.scatter_geo(_filtered_df,
+                          locations='country',
+                          locationmode='country names',
+                          size='population',
+                          color='continent',
+                          hover_name='country',
+                          hover_data=['population_density', 
+                                      'air_quality_index',
+                                      'water_quality_index'],
+                          title='Population by Country')
+
+@st.cache_data
+def _build_quality_scatter(_filtered_df: pd.DataFrame, continents: tuple, data_mtime_ns: int):
+    """Build the air vs water quality scatter for the selected continents"""
+    return px.scatter(_filtered_df,
+                      x='air_quality_index',
+                      y='water_quality_index',
+                      size='population',
+                      color='continent',
+                      hover_name='country',
+                      title='Air Quality vs Water Quality')
+
+def _continent_mask(continent: pd.Series, selected: list) -> np.ndarray:
+    """Boolean mask of rows whose continent is in the selection"""
+    if isinstance(continent.dtype, pd.CategoricalDtype):
+        # Compare int8 category codes instead of strings
+        cat_codes = {c: i for i, c in enumerate(continent.cat.categories)}
+        selected_codes = np.fromiter((cat_codes[c] for c in selected), dtype='int8', count=len(selected))
+        return np.isin(continent.cat.codes.to_numpy(), selected_codes)
+    return continent.isin(selected).to_numpy()
+
 def main():
     st.title("Global Country Analysis Dashboard")
     
@@ -12,14 +50,15 @@ def main():
     
     # Sidebar for filters
     st.sidebar.title("Filters")
+    continents = sorted(df['continent'].unique())
     selected_continent = st.sidebar.multiselect(
         "Select Continents",
-        options=sorted(df['continent'].unique()),
-        default=sorted(df['continent'].unique())
+        options=continents,
+        default=continents
     )
     
     # Filter data
-    filtered_df = df[df['continent'].isin(selected_continent)]
+    filtered_df = df[_continent_mask(df['continent'], selected_continent)]
     
     # Main content
     st.header("Country Overview")
@@ -35,28 +74,15 @@ def main():
         st.metric("Avg Water Quality Index", f"{stats['avg_water_quality']:.1f}")
     
     # Population Map
+    continents_key = tuple(sorted(selected_continent))
+    data_mtime_ns = (handler.data_dir / 'country_data.parquet').stat().st_mtime_ns
     st.subheader("Population Distribution")
-    fig = px.scatter_geo(filtered_df,
-                        locations='country',
-                        locationmode='country names',
-                        size='population',
-                        color='continent',
-                        hover_name='country',
-                        hover_data=['population_density', 
-                                  'air_quality_index',
-                                  'water_quality_index'],
-                        title='Population by Country')
+    fig = _build_population_map(filtered_df, continents_key, data_mtime_ns)
     st.plotly_chart(fig)
     
     # Additional visualizations
     st.subheader("Quality Indices by Country")
-    quality_fig = px.scatter(filtered_df,
-                           x='air_quality_index',
-                           y='water_quality_index',
-                           size='population',
-                           color='continent',
-                           hover_name='country',
-                           title='Air Quality vs Water Quality')
+    quality_fig = _build_quality_scatter(filtered_df, continents_key, data_mtime_ns)
     st.plotly_chart(quality_fig)
     
     # Display detailed data
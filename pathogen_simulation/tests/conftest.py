@@ -0,0 +1,5 @@
+# Make the app's top-level packages (core, data, visualizations) importable
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,61 @@
+import os
+
+from src.data_handler import _COLUMN_DTYPES, CountryDataHandler, create_top_50_countries
+
+def _handler(tmp_path):
+    handler = CountryDataHandler()
+    handler.data_dir = tmp_path
+    return handler
+
+def test_loaded_country_data_uses_spread_dtypes(tmp_path):
+    # A file written with wide dtypes is narrowed once when loaded
+    create_top_50_countries().astype({'population_density': 'float64', 'population': 'uint32'}).to_parquet(
+        tmp_path / 'country_data.parquet', index=False
+    )
+    df = _handler(tmp_path).load_country_data()
+    
+    assert df.dtypes[list(_COLUMN_DTYPES)].astype(str).to_dict() == _COLUMN_DTYPES
+
+def test_first_load_does_not_expose_the_cached_frame(tmp_path):
+    create_top_50_countries().to_parquet(tmp_path / 'country_data.parquet', index=False)
+    handler = _handler(tmp_path)
+    
+    first = handler.load_country_data()
+    first['extra'] = 1
+    first.drop(columns='continent', inplace=True)
+    
+    again = handler.load_country_data()
+    assert 'extra' not in again.columns
+    assert 'continent' in again.columns
+
+def test_legacy_csv_with_missing_columns_is_reinitialized(tmp_path):
+    create_top_50_countries()[['country', 'population', 'continent']].to_csv(
+        tmp_path / 'country_data.csv', index=False
+    )
+    df = _handler(tmp_path).load_country_data()
+    
+    assert len(df) == 50
+    assert set(_COLUMN_DTYPES) <= set(df.columns)
+
+def test_partial_frames_can_be_saved(tmp_path):
+    handler = _handler(tmp_path)
+    partial = create_top_50_countries()[['country', 'population', 'continent']]
+    handler.save_country_data(partial, 'partial.parquet')
+    
+    assert list(handler.load_country_data('partial.parquet').columns) == ['country', 'population', 'continent']
+
+def test_stats_follow_saves_within_one_float_mtime(tmp_path):
+    handler = _handler(tmp_path)
+    path = tmp_path / 'country_data.parquet'
+    mtime_ns = 1_700_000_000_000_000_000
+    
+    handler.save_country_data(create_top_50_countries())
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert handler.get_country_stats()['total_countries'] == 50
+    assert handler.get_country_statistics()['total_countries'] == 50
+    
+    # Both saves round to the same float st_mtime; only st_mtime_ns tells them apart
+    handler.save_country_data(create_top_50_countries().head(10))
+    os.utime(path, ns=(mtime_ns + 100, mtime_ns + 100))
+    assert handler.get_country_stats()['total_countries'] == 10
+    assert handler.get_country_statistics()['total_countries'] == 10
@@ -0,0 +1,9 @@
+from src.data_handler import create_top_50_countries
+from visualizations.healthcare_load import _with_world_row
+
+def test_world_row_keeps_population_integral():
+    countries = create_top_50_countries()
+    df = _with_world_row(countries)
+    
+    assert df['population'].dtype == countries['population'].dtype
+    assert df.loc['World', 'population'] == countries['population'].sum()
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from core import seir
+from data.disease_params import PathogenParams
+
+def _core_args(params):
+    N, S0, E0, I0, R0, D0 = seir._INITIAL_STATE
+    rates = (params.transmission_rate / 100, 1 / params.incubation_period,
+             1 / params.infectious_period, params.mortality_rate / 100)
+    return tuple(np.float32(x) for x in rates + (N, S0, E0, I0, R0, D0)) + (100,)
+
+def test_compiled_core_returns_float32():
+    pytest.importorskip('numba')
+    result = seir.calculate_infection_progression(PathogenParams())
+    
+    assert all(getattr(result, c).dtype == np.float32 for c in 'SEIRD')
+
+def test_compiled_core_matches_python_reference():
+    pytest.importorskip('numba')
+    args = _core_args(PathogenParams())
+    
+    compiled = seir._seir_core(*args)
+    reference = seir._seir_core.py_func(*args)
+    for got, expected in zip(compiled, reference):
+        np.testing.assert_allclose(got, expected, rtol=1e-4, atol=1e-2)
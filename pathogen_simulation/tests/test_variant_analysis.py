@@ -0,0 +1,30 @@
+import numpy as np
+
+from data.disease_params import PathogenParams
+from visualizations.variant_analysis import _MAX_BETA, _build_variant_trajectories, _variant_betas
+
+def _variant(name, daily_cases):
+    return {
+        'name': name, '_cases_col': f'{name}_cases', 'daily_cases': daily_cases, 'severity': 5,
+        'mortality_rate': 1.0, 'recovery_rate': 90.0, 'vaccine_effectiveness': 80.0
+    }
+
+def test_variant_betas_scale_pathogen_transmission():
+    betas = _variant_betas(PathogenParams(transmission_rate=50.0), np.array([10.0, 30.0]))
+    np.testing.assert_allclose(betas, [0.25, 0.75])
+
+def test_variant_betas_without_cases_use_pathogen_transmission():
+    betas = _variant_betas(PathogenParams(transmission_rate=50.0), np.zeros(2))
+    np.testing.assert_allclose(betas, [0.5, 0.5])
+
+def test_large_daily_cases_keep_trajectories_finite():
+    variants = [_variant('A', 1.0), _variant('B', 500.0)]
+    variants_key = tuple(tuple(sorted(v.items())) for v in variants)
+    betas = _variant_betas(PathogenParams(transmission_rate=100.0), np.array([10.0, 5000.0]))
+    assert betas.max() <= _MAX_BETA
+    
+    fig = _build_variant_trajectories(PathogenParams(transmission_rate=100.0), variants_key)
+    for trace in fig.data:
+        infected = np.asarray(trace.y)
+        assert np.isfinite(infected).all()
+        assert (infected >= 0).all()
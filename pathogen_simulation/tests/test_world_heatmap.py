@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.disease_params import PathogenParams
+from src.data_handler import create_top_50_countries
+from visualizations import world_heatmap as wh
+
+def _spread_data():
+    countries = create_top_50_countries().join(wh._COORD_DF, on='country').fillna({'latitude': 0, 'longitude': 0})
+    return wh.calculate_global_spread(PathogenParams(), countries, (), ())
+
+def test_map_is_centered_over_the_countries():
+    data = _spread_data()
+    fig = wh.create_map_visualization(data, [])
+    
+    assert np.isclose(fig.layout.map.center.lat, data['latitude'].mean())
+    assert np.isclose(fig.layout.map.center.lon, data['longitude'].mean())
+    # The cached scaffolding itself is never filled in
+    assert wh._base_fig().layout.map.center.lat is None
+
+def test_rankings_csv_export_is_sorted_by_metric():
+    data = _spread_data()
+    csv = wh.convert_to_downloadable_csv(data, 'Total Cases', [])
+    
+    lines = csv.decode().splitlines()
+    assert lines[0] == 'country,active_cases,infection_rate,severity_index'
+    assert len(lines) == len(data) + 1
+    assert lines[1].startswith(data.loc[data['active_cases'].idxmax(), 'country'] + ',')
+
+def _variant(name, daily_cases, severity):
+    return {
+        'name': name, '_cases_col': f'{name}_cases', 'daily_cases': daily_cases, 'severity': severity,
+        'mortality_rate': 1.0, 'recovery_rate': 90.0, 'vaccine_effectiveness': 80.0
+    }
+
+@pytest.mark.parametrize('variants', [[], [_variant('A', 2.0, 5), _variant('B', 5.0, 8)]])
+def test_spread_kernel_matches_numpy_path(monkeypatch, variants):
+    pytest.importorskip('numba')
+    countries = create_top_50_countries().join(wh._COORD_DF, on='country').fillna({'latitude': 0, 'longitude': 0})
+    repeats = -(-wh._KERNEL_MIN_ROWS // len(countries))
+    large = pd.concat([countries] * repeats, ignore_index=True)
+    variants_key = tuple(tuple(sorted(v.items())) for v in variants)
+    vaccination_key = (
+        ('name', ('Vax',)), ('population_vaccinated', (50.0,)),
+        ('effectiveness', (90.0,)), ('waning_immunity_rate', (1.0,))
+    )
+    
+    def spread():
+        wh.calculate_global_spread.clear()
+        return wh.calculate_global_spread(PathogenParams(), large, variants_key, vaccination_key)
+    
+    kernel = spread()
+    monkeypatch.setattr(wh, 'HAVE_NUMBA', False)
+    reference = spread()
+    
+    assert list(kernel.columns) == list(reference.columns)
+    for column in ('risk_score', 'infection_rate', 'severity_index'):
+        np.testing.assert_allclose(kernel[column], reference[column], rtol=1e-5, atol=1e-6)
+    # Case counts truncate float32 products, so they may differ by rounding
+    for variant in variants:
+        assert np.abs(kernel[variant['_cases_col']] - reference[variant['_cases_col']]).max() <= 1
+    np.testing.assert_allclose(kernel['active_cases'], reference['active_cases'], rtol=1e-6, atol=1)
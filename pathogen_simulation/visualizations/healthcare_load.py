@@ -2,7 +2,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
 
 def initialize_healthcare_params():
     """Initialize healthcare parameters in session state if they don't exist"""
@@ -14,47 +14,62 @@ def initialize_healthcare_params():
             'transmission_rate': 5.0,  # base transmission rate percentage
         }
 
-def load_country_data():
-    """Load and process country data from CSV"""
-    df = pd.read_csv('pathogen_simulation/data/country_data.csv')
-    
-    # Calculate world totals and averages
-    world_data = {
-        'country': 'World',
-        'continent': 'Global',
-        'population': df['population'].sum(),
-        'population_density': df['population_density'].mean(),
-        'air_quality_index': df['air_quality_index'].mean(),
-        'water_quality_index': df['water_quality_index'].mean(),
-        'age_distribution_young': df['age_distribution_young'].mean(),
-        'age_distribution_adult': df['age_distribution_adult'].mean(),
-        'age_distribution_elderly': df['age_distribution_elderly'].mean(),
-        'gender_ratio': df['gender_ratio'].mean(),
-        'health_conditions_percentage': df['health_conditions_percentage'].mean()
-    }
+# Columns averaged into the World aggregate row (population is summed)
+_WORLD_MEAN_COLUMNS = [
+    'population_density', 'air_quality_index', 'water_quality_index',
+    'age_distribution_young', 'age_distribution_adult', 'age_distribution_elderly',
+    'gender_ratio', 'health_conditions_percentage'
+]
+
+@st.cache_data(show_spinner=False)
+def _with_world_row(df: pd.DataFrame):
+    """Append a World aggregate row to the shared country data"""
+    # Calculate world totals and averages in a single reduction
+    world_totals = df[['population'] + _WORLD_MEAN_COLUMNS].agg(
+        {'population': 'sum', **{col: 'mean' for col in _WORLD_MEAN_COLUMNS}}
+    )
+    world_data = {'country': 'World', 'continent': 'Global', **world_totals.to_dict()}
+    # The mixed reduction comes back as floats; keep population integral
+    world_data['population'] = int(world_totals['population'])
     
-    # Add world data to the dataframe
+    # Add world data to the dataframe, indexed by country for O(1) lookups
     df = pd.concat([df, pd.DataFrame([world_data])], ignore_index=True)
-    return df
+    return df.set_index('country', drop=False)
+
+@st.cache_data(show_spinner=False)
+def _country_index(df: pd.DataFrame) -> dict:
+    """Precompute the continent list and the countries shown for each continent"""
+    is_world = df['country'] == 'World'
+    by_continent = {'All': df['country'].tolist()}
+    for continent in df['continent'].unique():
+        by_continent[continent] = df.loc[(df['continent'] == continent) | is_world, 'country'].tolist()
+    return {
+        'continents': ['All'] + sorted(df['continent'].unique().tolist()),
+        'by_continent': by_continent
+    }
 
 def display_vaccination_params():
     """Display vaccination program parameters"""
+    vaccines = st.session_state.vaccination_params
     with st.sidebar.expander("Vaccination Parameters", expanded=False):
         # Show current vaccines
-        if st.session_state.vaccination_params['vaccines']:
+        if vaccines['name']:
             st.write("Current Vaccines:")
             vaccines_to_remove = []
-            for idx, vaccine in enumerate(st.session_state.vaccination_params['vaccines']):
+            for idx, name in enumerate(vaccines['name']):
                 col1, col2 = st.columns([3, 1])
                 with col1:
-                    st.write(f"**{vaccine['name']}**")
+                    st.write(f"**{name}**")
                 with col2:
                     if st.button("Remove", key=f"remove_vaccine_{idx}"):
                         vaccines_to_remove.append(idx)
             
             # Remove vaccines (if any) after the loop
             for idx in reversed(vaccines_to_remove):
-                st.session_state.vaccination_params['vaccines'].pop(idx)
+                st.session_state.vaccine_names.discard(vaccines['name'][idx])
+                for column in vaccines.values():
+                    column.pop(idx)
+            if vaccines_to_remove:
                 st.rerun()
 
         # Add new vaccine interface
@@ -62,7 +77,7 @@ def display_vaccination_params():
             new_vaccine = {
                 'name': st.text_input(
                     "Vaccine Name", 
-                    value=f"Vaccine {len(st.session_state.vaccination_params['vaccines']) + 1}"
+                    value=f"Vaccine {len(vaccines['name']) + 1}"
                 ),
                 'population_vaccinated': st.number_input(
                     "Population Vaccinated (%)", 
@@ -88,14 +103,15 @@ def display_vaccination_params():
             }
             
             # Store the new vaccine in session state
-            if not any(v['name'] == new_vaccine['name'] 
-                      for v in st.session_state.vaccination_params['vaccines']):
-                st.session_state.vaccination_params['vaccines'].append(new_vaccine)
+            if new_vaccine['name'] not in st.session_state.vaccine_names:
+                for field, value in new_vaccine.items():
+                    vaccines[field].append(value)
+                st.session_state.vaccine_names.add(new_vaccine['name'])
 
         # Display total number of vaccines
         st.metric(
             "Total Vaccines",
-            len(st.session_state.vaccination_params['vaccines'])
+            len(vaccines['name'])
         )
 
 def calculate_healthcare_metrics(params: dict, vaccination_params: dict, country_info: pd.Series, days: int = 30):
@@ -137,33 +153,54 @@ def calculate_healthcare_metrics(params: dict, vaccination_params: dict, country
        - Required ICU = Severe Cases(t) × ICU Rate
        - Required Ventilators = Severe Cases(t) × Ventilator Rate
     """
-    population = country_info['population'] / 100000  # Convert to per 100k units
+    # Reduce inputs to hashable primitives so repeated reruns hit the cache
+    metrics_df = _calculate_healthcare_metrics(
+        params['transmission_rate'],
+        params['hospital_beds'],
+        params['icu_beds'],
+        params['ventilators'],
+        tuple(vaccination_params['effectiveness']),
+        tuple(vaccination_params['population_vaccinated']),
+        tuple(vaccination_params['waning_immunity_rate']),
+        float(country_info['population']),
+        float(country_info['population_density']),
+        float(country_info['health_conditions_percentage']),
+        days
+    )
+    
+    # Dates are attached outside the cache so they always start from today
+    metrics_df.insert(0, 'date', pd.date_range(pd.Timestamp.now().floor('D'), periods=days, freq='D'))
+    return metrics_df
+
+@st.cache_data(show_spinner=False)
+def _calculate_healthcare_metrics(transmission_rate: float, hospital_beds: float, icu_beds: float,
+                                  ventilators: float, vaccine_effectiveness: tuple,
+                                  vaccine_coverage: tuple, vaccine_waning: tuple,
+                                  population: float, population_density: float,
+                                  health_conditions_percentage: float, days: int) -> pd.DataFrame:
+    """Cached core of calculate_healthcare_metrics (everything except dates)"""
+    population = population / 100000  # Convert to per 100k units
     
     # Initialize time series data
-    dates = [datetime.now() + timedelta(days=x) for x in range(days)]
     metrics = {
-        'date': dates,
-        'available_beds': [params['hospital_beds'] * (population/100)] * days,
-        'available_icu': [params['icu_beds'] * (population/100)] * days,
-        'available_ventilators': [params['ventilators'] * (population/100)] * days
+        'available_beds': np.full(days, hospital_beds * (population/100)),
+        'available_icu': np.full(days, icu_beds * (population/100)),
+        'available_ventilators': np.full(days, ventilators * (population/100))
     }
     
     # Calculate vaccination impact
     total_vaccination_effect = 0.0
-    if vaccination_params['vaccines']:
-        for vaccine in vaccination_params['vaccines']:
-            # Calculate reduction in transmission based on vaccine effectiveness and coverage
-            protection_factor = (
-                vaccine['effectiveness'] * 
-                vaccine['population_vaccinated'] / 100 * 
-                (1 - vaccine['waning_immunity_rate'] / 100)
-            )
-            total_vaccination_effect += protection_factor
+    if vaccine_effectiveness:
+        effectiveness = np.asarray(vaccine_effectiveness, dtype=np.float64)
+        coverage = np.asarray(vaccine_coverage, dtype=np.float64)
+        waning = np.asarray(vaccine_waning, dtype=np.float64)
+        # Reduction in transmission based on vaccine effectiveness and coverage
+        total_vaccination_effect = float((effectiveness * coverage / 100 * (1 - waning / 100)).sum())
     
     # Adjust transmission rate based on vaccination and other factors
-    base_transmission = params['transmission_rate'] / 100
-    density_factor = min(1.5, max(0.5, country_info['population_density'] / 500))
-    health_factor = min(1.5, max(0.5, country_info['health_conditions_percentage'] / 25))
+    base_transmission = transmission_rate / 100
+    density_factor = min(1.5, max(0.5, population_density / 500))
+    health_factor = min(1.5, max(0.5, health_conditions_percentage / 25))
     
     # Reduce transmission based on vaccination effect (capped at 95% reduction)
     vaccination_reduction = min(0.95, total_vaccination_effect / 100)
@@ -175,21 +212,29 @@ def calculate_healthcare_metrics(params: dict, vaccination_params: dict, country
     icu_rate = 0.30 * (1 - vaccination_reduction * 0.8)  # Vaccines reduce ICU needs
     ventilator_rate = 0.15 * (1 - vaccination_reduction * 0.8)  # Vaccines reduce ventilator needs
     
-    active_cases = []
-    current_cases = population * adjusted_transmission
-    
-    for _ in range(days):
-        current_cases = current_cases * (1 + adjusted_transmission - recovery_rate)
-        active_cases.append(current_cases)
+    # Cases grow geometrically: active(t) = initial * growth^(t+1)
+    initial_cases = population * adjusted_transmission
+    growth = 1 + adjusted_transmission - recovery_rate
+    active_cases = initial_cases * np.power(growth, np.arange(1, days + 1, dtype=np.float64))
     
     # Calculate required resources
-    severe_cases = [case * severity_rate for case in active_cases]
+    severe_cases = active_cases * severity_rate
     metrics['required_beds'] = severe_cases
-    metrics['required_icu'] = [case * icu_rate for case in severe_cases]
-    metrics['required_ventilators'] = [case * ventilator_rate for case in severe_cases]
+    metrics['required_icu'] = severe_cases * icu_rate
+    metrics['required_ventilators'] = severe_cases * ventilator_rate
     
     return pd.DataFrame(metrics)
 
+# (column, label, color, dash) for each line in the healthcare load chart
+_LOAD_TRACE_SPEC = (
+    ('available_beds', 'Hospital Bed Capacity', 'blue', 'dash'),
+    ('required_beds', 'Hospital Bed Usage', 'blue', 'solid'),
+    ('available_icu', 'ICU Bed Capacity', 'red', 'dash'),
+    ('required_icu', 'ICU Bed Usage', 'red', 'solid'),
+    ('available_ventilators', 'Ventilator Capacity', 'green', 'dash'),
+    ('required_ventilators', 'Ventilator Usage', 'green', 'solid')
+)
+
 def display_healthcare_load():
     """Display healthcare system load visualization with vaccination impact"""
     st.header("Healthcare System Load")
@@ -233,28 +278,25 @@ def display_healthcare_load():
     })
     
     # Load country data
-    country_df = load_country_data()
+    country_df = _with_world_row(st.session_state.country_df)
     
     # Add continent/country selection
-    continents = ['All'] + sorted(country_df['continent'].unique().tolist())
-    selected_continent = st.selectbox("Select Continent", continents)
-    
-    # Filter countries by continent
-    filtered_df = country_df if selected_continent == 'All' else country_df[
-        (country_df['continent'] == selected_continent) | (country_df['country'] == 'World')
-    ]
+    country_index = _country_index(country_df)
+    selected_continent = st.selectbox("Select Continent", country_index['continents'])
     
+    # Countries for the selected continent (always including World)
+    countries = country_index['by_continent'][selected_continent]
     selected_country = st.selectbox(
         "Select Country",
-        filtered_df['country'].tolist(),
-        index=filtered_df['country'].tolist().index('World')
+        countries,
+        index=countries.index('World')
     )
     
     # Time range selection
     projection_days = st.slider("Projection Days", 7, 90, 30)
     
     # Get country information
-    country_info = country_df[country_df['country'] == selected_country].iloc[0]
+    country_info = country_df.loc[selected_country]
     
     # Create tabs for different views
     tab1, tab2 = st.tabs(["Healthcare Load", "Vaccination Impact"])
@@ -268,113 +310,78 @@ def display_healthcare_load():
     )
     
     with tab1:
-        # Create line graph for healthcare load
-        fig_load = go.Figure()
-        
-        # Add hospital bed lines
-        fig_load.add_trace(go.Scatter(
-            x=metrics_df['date'], y=metrics_df['available_beds'],
-            name='Hospital Bed Capacity',
-            line=dict(color='blue', dash='dash')
-        ))
-        fig_load.add_trace(go.Scatter(
-            x=metrics_df['date'], y=metrics_df['required_beds'],
-            name='Hospital Bed Usage',
-            line=dict(color='blue')
-        ))
-        
-        # Add ICU bed lines
-        fig_load.add_trace(go.Scatter(
-            x=metrics_df['date'], y=metrics_df['available_icu'],
-            name='ICU Bed Capacity',
-            line=dict(color='red', dash='dash')
-        ))
-        fig_load.add_trace(go.Scatter(
-            x=metrics_df['date'], y=metrics_df['required_icu'],
-            name='ICU Bed Usage',
-            line=dict(color='red')
-        ))
-        
-        # Add ventilator lines
-        fig_load.add_trace(go.Scatter(
-            x=metrics_df['date'], y=metrics_df['available_ventilators'],
-            name='Ventilator Capacity',
-            line=dict(color='green', dash='dash')
-        ))
-        fig_load.add_trace(go.Scatter(
-            x=metrics_df['date'], y=metrics_df['required_ventilators'],
-            name='Ventilator Usage',
-            line=dict(color='green')
-        ))
-        
-        fig_load.update_layout(
-            title=f"Healthcare System Load Over Time - {selected_country}",
-            xaxis_title="Date",
-            yaxis_title="Number of Units",
-            hovermode='x unified',
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01
+        # Create line graph for healthcare load in a single construction
+        dates = metrics_df['date'].values
+        traces = [
+            go.Scatter(x=dates, y=metrics_df[col].to_numpy(), name=label, line=dict(color=color, dash=dash))
+            for col, label, color, dash in _LOAD_TRACE_SPEC
+        ]
+        fig_load = go.Figure(
+            data=traces,
+            layout=go.Layout(
+                title=f"Healthcare System Load Over Time - {selected_country}",
+                xaxis_title="Date",
+                yaxis_title="Number of Units",
+                hovermode='x unified',
+                legend=dict(
+                    yanchor="top",
+                    y=0.99,
+                    xanchor="left",
+                    x=0.01
+                )
             )
         )
         
         st.plotly_chart(fig_load, use_container_width=True)
     
     with tab2:
-        # Debug information at the top of the tab
-        st.write("Debug: Checking vaccination data...")
-        st.write(f"Vaccines in session state: {len(st.session_state.vaccination_params.get('vaccines', []))}")
-        
         # Ensure we're getting the latest data
-        current_vaccines = st.session_state.vaccination_params.get('vaccines', [])
+        current_vaccines = st.session_state.vaccination_params
         
-        if current_vaccines:
-            st.write(f"Found {len(current_vaccines)} vaccines")
-            # Create DataFrame from current vaccine data
-            vaccines_df = pd.DataFrame(current_vaccines)
-            
-            # Main vaccination metrics chart
-            fig_vac = go.Figure()
+        if current_vaccines['name']:
+            # Columnar vaccine data as arrays
+            names = current_vaccines['name']
+            coverage = np.asarray(current_vaccines['population_vaccinated'], dtype=np.float64)
+            effectiveness = np.asarray(current_vaccines['effectiveness'], dtype=np.float64)
+            waning = np.asarray(current_vaccines['waning_immunity_rate'], dtype=np.float64)
             
-            # Add bars for population coverage and effectiveness
-            fig_vac.add_trace(go.Bar(
-                x=vaccines_df['name'],
-                y=vaccines_df['population_vaccinated'],
-                name='Population Coverage',
-                marker_color='rgb(49, 130, 189)'
-            ))
-            
-            fig_vac.add_trace(go.Bar(
-                x=vaccines_df['name'],
-                y=vaccines_df['effectiveness'],
-                name='Vaccine Effectiveness',
-                marker_color='rgb(204, 204, 204)'
-            ))
-            
-            # Add waning immunity rate as a line
-            fig_vac.add_trace(go.Scatter(
-                x=vaccines_df['name'],
-                y=vaccines_df['waning_immunity_rate'],
-                name='Monthly Waning Rate',
-                mode='lines+markers',
-                line=dict(color='rgb(255, 127, 14)'),
-                yaxis='y2'
-            ))
-            
-            # Update layout with dual y-axes
-            fig_vac.update_layout(
-                title="Vaccination Program Metrics",
-                xaxis_title="Vaccine",
-                yaxis_title="Percentage (%)",
-                yaxis2=dict(
-                    title="Monthly Waning Rate (%)",
-                    overlaying='y',
-                    side='right'
-                ),
-                barmode='group',
-                hovermode='x unified'
+            # Main vaccination metrics chart: bars for population coverage and
+            # effectiveness, waning immunity rate as a line on a second axis
+            fig_vac = go.Figure(
+                data=[
+                    go.Bar(
+                        x=names,
+                        y=coverage,
+                        name='Population Coverage',
+                        marker_color='rgb(49, 130, 189)'
+                    ),
+                    go.Bar(
+                        x=names,
+                        y=effectiveness,
+                        name='Vaccine Effectiveness',
+                        marker_color='rgb(204, 204, 204)'
+                    ),
+                    go.Scatter(
+                        x=names,
+                        y=waning,
+                        name='Monthly Waning Rate',
+                        mode='lines+markers',
+                        line=dict(color='rgb(255, 127, 14)'),
+                        yaxis='y2'
+                    )
+                ],
+                layout=go.Layout(
+                    title="Vaccination Program Metrics",
+                    xaxis_title="Vaccine",
+                    yaxis_title="Percentage (%)",
+                    yaxis2=dict(
+                        title="Monthly Waning Rate (%)",
+                        overlaying='y',
+                        side='right'
+                    ),
+                    barmode='group',
+                    hovermode='x unified'
+                )
             )
             
             st.plotly_chart(fig_vac, use_container_width=True)
@@ -383,24 +390,19 @@ def display_healthcare_load():
             col1, col2, col3 = st.columns(3)
             
             # Calculate total coverage considering effectiveness and waning
-            effective_coverage = sum(
-                row['population_vaccinated'] * 
-                row['effectiveness'] * 
-                (1 - row['waning_immunity_rate']/100) 
-                for _, row in vaccines_df.iterrows()
-            ) / 100  # Convert to percentage
+            effective_coverage = float((coverage * effectiveness * (1 - waning/100)).sum()) / 100  # Convert to percentage
             
             with col1:
                 st.metric(
                     "Average Population Coverage",
-                    f"{vaccines_df['population_vaccinated'].mean():.1f}%",
+                    f"{coverage.mean():.1f}%",
                     help="Average percentage of population covered by vaccines"
                 )
             
             with col2:
                 st.metric(
                     "Average Vaccine Effectiveness",
-                    f"{vaccines_df['effectiveness'].mean():.1f}%",
+                    f"{effectiveness.mean():.1f}%",
                     help="Average effectiveness of all vaccines"
                 )
             
@@ -416,12 +418,12 @@ def display_healthcare_load():
             impact_cols = st.columns(3)
             
             # Calculate average reduction in resource needs
-            bed_reduction = (1 - metrics_df['required_beds'].mean() / 
-                           (metrics_df['available_beds'].mean() * 2)) * 100
-            icu_reduction = (1 - metrics_df['required_icu'].mean() / 
-                           (metrics_df['available_icu'].mean() * 2)) * 100
-            vent_reduction = (1 - metrics_df['required_ventilators'].mean() / 
-                            (metrics_df['available_ventilators'].mean() * 2)) * 100
+            means = metrics_df[['required_beds', 'available_beds',
+                                'required_icu', 'available_icu',
+                                'required_ventilators', 'available_ventilators']].mean()
+            bed_reduction = (1 - means['required_beds'] / (means['available_beds'] * 2)) * 100
+            icu_reduction = (1 - means['required_icu'] / (means['available_icu'] * 2)) * 100
+            vent_reduction = (1 - means['required_ventilators'] / (means['available_ventilators'] * 2)) * 100
             
             with impact_cols[0]:
                 st.metric(
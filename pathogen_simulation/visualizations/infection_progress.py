@@ -1,64 +1,58 @@
 # Infection progression visualization
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-
-def calculate_infection_progression(params: dict, num_days: int = 100):
-    """
-    Calculate SEIR model progression based on input parameters
-    """
-    # Initial population parameters
-    N = 100000  # Total population
-    I0 = 100    # Initial infected
-    E0 = 200    # Initial exposed
-    R0 = 0      # Initial recovered
-    D0 = 0      # Initial deceased
-    S0 = N - I0 - E0 - R0 - D0  # Initial susceptible
-    
-    # Convert rates to daily probabilities
-    beta = params['transmission_rate'] / 100  # Transmission rate
-    sigma = 1 / params['incubation_period']   # Rate of exposed becoming infected
-    gamma = 1 / params['infectious_period']    # Recovery rate
-    mu = params['mortality_rate'] / 100        # Mortality rate
+from core import seir
+from data.disease_params import PathogenParams
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def calculate_infection_progression(params: PathogenParams, num_days: int = 100):
+    """Cached SEIR progression for the given parameters"""
+    return seir.calculate_infection_progression(params, num_days)
+
+# SEIR compartments, their result fields and line colors
+_SEIR_TRACE_SPEC = (
+    ('Susceptible', 'S', 'blue'),
+    ('Exposed', 'E', 'orange'),
+    ('Infected', 'I', 'red'),
+    ('Recovered', 'R', 'green'),
+    ('Deceased', 'D', 'black')
+)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_progression_figure(params: PathogenParams, num_days: int = 100):
+    """Build the SEIR progression figure for the given parameters"""
+    result = calculate_infection_progression(params, num_days)
     
-    # Initialize arrays to store values
-    S = np.zeros(num_days)
-    E = np.zeros(num_days)
-    I = np.zeros(num_days)
-    R = np.zeros(num_days)
-    D = np.zeros(num_days)
+    # Create the main progression plot
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Disease Progression', 'Daily New Cases'),
+        vertical_spacing=0.15
+    )
     
-    # Set initial values
-    S[0] = S0
-    E[0] = E0
-    I[0] = I0
-    R[0] = R0
-    D[0] = D0
+    # Add SEIR curves and daily new cases in one batch
+    traces = [
+        go.Scatter(x=result.day, y=getattr(result, field), name=name, line=dict(color=color))
+        for name, field, color in _SEIR_TRACE_SPEC
+    ]
+    daily_new = np.empty_like(result.I)
+    daily_new[0] = 0
+    np.subtract(result.I[1:], result.I[:-1], out=daily_new[1:])
+    traces.append(go.Bar(x=result.day, y=daily_new, name='New Cases', marker_color='red'))
+    fig.add_traces(traces, rows=[1] * len(_SEIR_TRACE_SPEC) + [2], cols=[1] * len(traces))
     
-    # Calculate progression
-    for t in range(1, num_days):
-        # SEIR model differential equations
-        new_exposed = (beta * S[t-1] * I[t-1]) / N
-        new_infected = sigma * E[t-1]
-        new_recovered = gamma * I[t-1] * (1 - mu)
-        new_deceased = gamma * I[t-1] * mu
-        
-        S[t] = S[t-1] - new_exposed
-        E[t] = E[t-1] + new_exposed - new_infected
-        I[t] = I[t-1] + new_infected - new_recovered - new_deceased
-        R[t] = R[t-1] + new_recovered
-        D[t] = D[t-1] + new_deceased
+    # Update layout
+    fig.update_layout(
+        height=800,
+        showlegend=True,
+        title_text="Disease Spread Analysis",
+        hovermode='x unified',
+        uirevision='seir'  # Keep zoom/pan when parameters change
+    )
     
-    return pd.DataFrame({
-        'Day': range(num_days),
-        'Susceptible': S,
-        'Exposed': E,
-        'Infected': I,
-        'Recovered': R,
-        'Deceased': D
-    })
+    return fig
 
 def display_infection_progress():
     st.header("Infection Progression")
@@ -68,60 +62,11 @@ def display_infection_progress():
     
     with col1:
         # Get relevant parameters from session state
-        params = {
-            'transmission_rate': st.session_state.pathogen_params['transmission_rate'],
-            'incubation_period': st.session_state.pathogen_params['incubation_period'],
-            'infectious_period': st.session_state.pathogen_params['infectious_period'],
-            'recovery_rate': st.session_state.pathogen_params['recovery_rate'],
-            'mortality_rate': st.session_state.pathogen_params['mortality_rate']
-        }
+        params = st.session_state.pathogen_params
         
         # Calculate the progression
-        df = calculate_infection_progression(params)
-        
-        # Create the main progression plot
-        fig = make_subplots(
-            rows=2, cols=1,
-            subplot_titles=('Disease Progression', 'Daily New Cases'),
-            vertical_spacing=0.15
-        )
-        
-        # Add SEIR curves
-        fig.add_trace(
-            go.Scatter(x=df['Day'], y=df['Susceptible'], name='Susceptible', line=dict(color='blue')),
-            row=1, col=1
-        )
-        fig.add_trace(
-            go.Scatter(x=df['Day'], y=df['Exposed'], name='Exposed', line=dict(color='orange')),
-            row=1, col=1
-        )
-        fig.add_trace(
-            go.Scatter(x=df['Day'], y=df['Infected'], name='Infected', line=dict(color='red')),
-            row=1, col=1
-        )
-        fig.add_trace(
-            go.Scatter(x=df['Day'], y=df['Recovered'], name='Recovered', line=dict(color='green')),
-            row=1, col=1
-        )
-        fig.add_trace(
-            go.Scatter(x=df['Day'], y=df['Deceased'], name='Deceased', line=dict(color='black')),
-            row=1, col=1
-        )
-        
-        # Calculate and plot daily new cases
-        daily_new = df['Infected'].diff()
-        fig.add_trace(
-            go.Bar(x=df['Day'], y=daily_new, name='New Cases', marker_color='red'),
-            row=2, col=1
-        )
-        
-        # Update layout
-        fig.update_layout(
-            height=800,
-            showlegend=True,
-            title_text="Disease Spread Analysis",
-            hovermode='x unified'
-        )
+        result = calculate_infection_progression(params)
+        fig = _build_progression_figure(params)
         
         # Display the plot
         st.plotly_chart(fig, use_container_width=True)
@@ -130,10 +75,11 @@ def display_infection_progress():
         st.subheader("Key Statistics")
         
         # Calculate key metrics
-        peak_infected = int(df['Infected'].max())
-        peak_day = df.loc[df['Infected'].idxmax(), 'Day']
-        total_infected = int(df['Infected'].sum())
-        total_deceased = int(df['Deceased'].iloc[-1])
+        peak_idx = int(np.argmax(result.I))
+        peak_infected = int(result.I[peak_idx])
+        peak_day = result.day[peak_idx]
+        total_infected = int(result.I.sum())
+        total_deceased = int(result.D[-1])
         mortality_percentage = (total_deceased / total_infected * 100) if total_infected > 0 else 0
         
         # Display metrics
@@ -145,11 +91,11 @@ def display_infection_progress():
         
         # Display current parameters used
         st.subheader("Current Parameters")
-        st.write(f"Transmission Rate: {params['transmission_rate']}%")
-        st.write(f"Incubation Period: {params['incubation_period']} days")
-        st.write(f"Infectious Period: {params['infectious_period']} days")
-        st.write(f"Recovery Rate: {params['recovery_rate']}%")
-        st.write(f"Mortality Rate: {params['mortality_rate']}%")
+        st.write(f"Transmission Rate: {params.transmission_rate}%")
+        st.write(f"Incubation Period: {params.incubation_period} days")
+        st.write(f"Infectious Period: {params.infectious_period} days")
+        st.write(f"Recovery Rate: {params.recovery_rate}%")
+        st.write(f"Mortality Rate: {params.mortality_rate}%")
 
 # INFECTION PROGRESSION MATHEMATICAL EXPLANATIONS
 
@@ -199,6 +145,12 @@ I(t) = I(t-1) + dI - dR - dD
 R(t) = R(t-1) + dR
 D(t) = D(t-1) + dD
 
+Integration:
+   Each day advances with a classical 4th-order Runge-Kutta step (dt = 1 day):
+   k1 = f(y), k2 = f(y + dt/2*k1), k3 = f(y + dt/2*k2), k4 = f(y + dt*k3)
+   y(t) = y(t-1) + dt/6 * (k1 + 2*k2 + 2*k3 + k4)
+   With β = 0 the exact exponential solution is used instead.
+
 Key Metrics Calculations:
 
 1. Peak Infected:
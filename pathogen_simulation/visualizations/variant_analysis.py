@@ -1,26 +1,94 @@
 # Variant analysis visualization
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
+from data.disease_params import PathogenParams
+from core.seir import calculate_infection_progression_batch
 
-def calculate_variant_metrics(params: dict, variants: list):
+# Parallel coordinates axes: metric column, label and upper bound
+_PARCOORDS_DIMENSIONS = (
+    ('transmission_rate', 'Transmission Rate', 100),
+    ('severity', 'Severity', 10),
+    ('mortality_rate', 'Mortality Rate', 100),
+    ('vaccine_effectiveness', 'Vaccine Effectiveness', 100)
+)
+
+# Largest daily transmission rate a variant trajectory is integrated with
+_MAX_BETA = 1.0
+
+def _variant_columns(variants_tuple: tuple) -> dict:
+    """Gather variant metrics into one NumPy array per field"""
+    variants = [dict(v) for v in variants_tuple]
+    count = len(variants)
+    return {
+        'name': [v['name'] for v in variants],
+        # Scale up for visibility
+        'transmission_rate': np.fromiter((v.get('daily_cases', 0) * 10 for v in variants), dtype=np.float64, count=count),
+        'severity': np.fromiter((v['severity'] for v in variants), dtype=np.int64, count=count),
+        'mortality_rate': np.fromiter((v['mortality_rate'] for v in variants), dtype=np.float64, count=count),
+        'vaccine_effectiveness': np.fromiter((v['vaccine_effectiveness'] for v in variants), dtype=np.float64, count=count)
+    }
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def calculate_variant_metrics(variants_tuple: tuple):
     """
     Calculate metrics for different variants
     """
-    base_transmission = params['transmission_rate']
-    variant_data = []
+    return pd.DataFrame(_variant_columns(variants_tuple))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_variant_figure(variants_tuple: tuple):
+    """Build the parallel coordinates comparison for the given variants"""
+    columns = _variant_columns(variants_tuple)
     
-    for variant in variants:
-        relative_transmission = variant.get('daily_cases', 0) * 10  # Scale up for visibility
-        variant_data.append({
-            'name': variant['name'],
-            'transmission_rate': relative_transmission,
-            'severity': variant['severity'],
-            'mortality_rate': variant['mortality_rate'],
-            'vaccine_effectiveness': variant['vaccine_effectiveness']
-        })
+    # Create parallel coordinates plot for variant comparison
+    fig = go.Figure(data=
+        go.Parcoords(
+            line=dict(color=np.arange(len(columns['name'])),
+                     colorscale='Viridis'),
+            dimensions=[
+                dict(range=[0, upper], label=label, values=columns[field])
+                for field, label, upper in _PARCOORDS_DIMENSIONS
+            ]
+        )
+    )
+    fig.update_layout(title='Variant Comparison')
+    return fig
+
+def _variant_betas(params: PathogenParams, variant_cases: np.ndarray) -> np.ndarray:
+    """Pathogen transmission scaled by each variant's cases relative to the average variant"""
+    mean_cases = variant_cases.mean()
+    relative_cases = variant_cases / mean_cases if mean_cases > 0 else np.ones_like(variant_cases)
+    # Cap at the pathogen input's 100% so the one-day RK4 step stays stable
+    return np.clip(params.transmission_rate / 100 * relative_cases, 0, _MAX_BETA)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_variant_trajectories(params: PathogenParams, variants_tuple: tuple):
+    """Build active-infection curves for every variant from one batched SEIR run"""
+    columns = _variant_columns(variants_tuple)
     
-    return pd.DataFrame(variant_data)
+    # Variants share the pathogen's periods; spread scales with their share of cases
+    result = calculate_infection_progression_batch(
+        beta=_variant_betas(params, columns['transmission_rate']),
+        sigma=1 / params.incubation_period,
+        gamma=1 / params.infectious_period,
+        mu=columns['mortality_rate'] / 100
+    )
+    
+    fig = go.Figure(
+        data=[
+            go.Scatter(x=result.day, y=result.I[:, i], name=name)
+            for i, name in enumerate(columns['name'])
+        ]
+    )
+    fig.update_layout(
+        title='Active Infections by Variant',
+        xaxis_title='Day',
+        yaxis_title='Infected',
+        hovermode='x unified'
+    )
+    return fig
 
 def display_variant_tracking():
     st.header("Variant Analysis")
@@ -29,37 +97,18 @@ def display_variant_tracking():
         st.warning("No variants have been added yet. Add variants in the sidebar to see analysis.")
         return
     
-    variant_data = calculate_variant_metrics(
-        st.session_state.pathogen_params,
-        st.session_state.variants
-    )
+    params = st.session_state.pathogen_params
+    variants_key = tuple(tuple(sorted(v.items())) for v in st.session_state.variants)
+    variant_data = calculate_variant_metrics(variants_key)
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # Create parallel coordinates plot for variant comparison
-        fig = go.Figure(data=
-            go.Parcoords(
-                line=dict(color=variant_data.index,
-                         colorscale='Viridis'),
-                dimensions=[
-                    dict(range=[0, 100],
-                         label='Transmission Rate',
-                         values=variant_data['transmission_rate']),
-                    dict(range=[0, 10],
-                         label='Severity',
-                         values=variant_data['severity']),
-                    dict(range=[0, 100],
-                         label='Mortality Rate',
-                         values=variant_data['mortality_rate']),
-                    dict(range=[0, 100],
-                         label='Vaccine Effectiveness',
-                         values=variant_data['vaccine_effectiveness'])
-                ]
-            )
-        )
-        fig.update_layout(title='Variant Comparison')
+        fig = _build_variant_figure(variants_key)
         st.plotly_chart(fig, use_container_width=True)
+        
+        # Simulate every variant's trajectory together
+        st.plotly_chart(_build_variant_trajectories(params, variants_key), use_container_width=True)
     
     with col2:
         st.subheader("Variant Details")
@@ -1,63 +1,81 @@
 import streamlit as st
-import plotly.express as px
+import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 import os
+from core.spread import HAVE_NUMBA, spread_kernel
+from data.disease_params import PathogenParams
 
-def load_country_coordinates():
-    """Load country coordinates mapping"""
-    return {
-        'China': (35.8617, 104.1954),
-        'India': (20.5937, 78.9629),
-        'United States': (37.0902, -95.7129),
-        'Indonesia': (-0.7893, 113.9213),
-        'Pakistan': (30.3753, 69.3451),
-        'Brazil': (-14.2350, -51.9253),
-        'Nigeria': (9.0820, 8.6753),
-        'Bangladesh': (23.6850, 90.3563),
-        'Russia': (61.5240, 105.3188),
-        'Mexico': (23.6345, -102.5528),
-        'Japan': (36.2048, 138.2529),
-        'Ethiopia': (9.1450, 40.4897),
-        'Philippines': (12.8797, 121.7740),
-        'Egypt': (26.8206, 30.8025),
-        'Vietnam': (14.0583, 108.2772),
-        'DR Congo': (-4.0383, 21.7587),
-        'Turkey': (38.9637, 35.2433),
-        'Iran': (32.4279, 53.6880),
-        'Germany': (51.1657, 10.4515),
-        'Thailand': (15.8700, 100.9925),
-        'United Kingdom': (55.3781, -3.4360),
-        'France': (46.2276, 2.2137),
-        'Italy': (41.8719, 12.5674),
-        'South Africa': (-30.5595, 22.9375),
-        'Tanzania': (-6.3690, 34.8888),
-        'Myanmar': (21.9162, 95.9560),
-        'South Korea': (35.9078, 127.7669),
-        'Colombia': (4.5709, -74.2973),
-        'Kenya': (-0.0236, 37.9062),
-        'Spain': (40.4637, -3.7492),
-        'Argentina': (-38.4161, -63.6167),
-        'Algeria': (28.0339, 1.6596),
-        'Sudan': (12.8628, 30.2176),
-        'Uganda': (1.3733, 32.2903),
-        'Iraq': (33.2232, 43.6793),
-        'Poland': (51.9194, 19.1451),
-        'Canada': (56.1304, -106.3468),
-        'Morocco': (31.7917, -7.0926),
-        'Saudi Arabia': (23.8859, 45.0792),
-        'Uzbekistan': (41.3775, 64.5853),
-        'Malaysia': (4.2105, 101.9758),
-        'Peru': (-9.1900, -75.0152),
-        'Afghanistan': (33.9391, 67.7100),
-        'Venezuela': (6.4238, -66.5897),
-        'Ghana': (7.9465, -1.0232),
-        'Angola': (-11.2027, 17.8739),
-        'Nepal': (28.3949, 84.1240),
-        'Yemen': (15.5527, 48.5164),
-        'North Korea': (40.3399, 127.5101),
-        'Australia': (-25.2744, 133.7751)
-    }
+# Country columns combined into the risk score and their weights
+_RISK_COLUMNS = ['population_density', 'air_quality_index', 'water_quality_index', 'health_conditions_percentage']
+_RISK_WEIGHTS = np.array([0.3, 0.2, 0.2, 0.3], dtype=np.float32)
+
+# Columns combined into the base severity and their weights
+_SEVERITY_COLUMNS = ['population_density', 'health_conditions_percentage', 'infection_rate']
+_SEVERITY_WEIGHTS = np.array([0.4, 0.3, 0.3], dtype=np.float32)
+
+# Country tables at least this large use the compiled spread kernel
+_KERNEL_MIN_ROWS = 10000
+
+# Largest marker diameter on the map, in pixels
+_MAP_SIZE_MAX = 50
+
+# Country coordinates (latitude, longitude)
+_COUNTRY_COORDS = {
+    'China': (35.8617, 104.1954),
+    'India': (20.5937, 78.9629),
+    'United States': (37.0902, -95.7129),
+    'Indonesia': (-0.7893, 113.9213),
+    'Pakistan': (30.3753, 69.3451),
+    'Brazil': (-14.2350, -51.9253),
+    'Nigeria': (9.0820, 8.6753),
+    'Bangladesh': (23.6850, 90.3563),
+    'Russia': (61.5240, 105.3188),
+    'Mexico': (23.6345, -102.5528),
+    'Japan': (36.2048, 138.2529),
+    'Ethiopia': (9.1450, 40.4897),
+    'Philippines': (12.8797, 121.7740),
+    'Egypt': (26.8206, 30.8025),
+    'Vietnam': (14.0583, 108.2772),
+    'DR Congo': (-4.0383, 21.7587),
+    'Turkey': (38.9637, 35.2433),
+    'Iran': (32.4279, 53.6880),
+    'Germany': (51.1657, 10.4515),
+    'Thailand': (15.8700, 100.9925),
+    'United Kingdom': (55.3781, -3.4360),
+    'France': (46.2276, 2.2137),
+    'Italy': (41.8719, 12.5674),
+    'South Africa': (-30.5595, 22.9375),
+    'Tanzania': (-6.3690, 34.8888),
+    'Myanmar': (21.9162, 95.9560),
+    'South Korea': (35.9078, 127.7669),
+    'Colombia': (4.5709, -74.2973),
+    'Kenya': (-0.0236, 37.9062),
+    'Spain': (40.4637, -3.7492),
+    'Argentina': (-38.4161, -63.6167),
+    'Algeria': (28.0339, 1.6596),
+    'Sudan': (12.8628, 30.2176),
+    'Uganda': (1.3733, 32.2903),
+    'Iraq': (33.2232, 43.6793),
+    'Poland': (51.9194, 19.1451),
+    'Canada': (56.1304, -106.3468),
+    'Morocco': (31.7917, -7.0926),
+    'Saudi Arabia': (23.8859, 45.0792),
+    'Uzbekistan': (41.3775, 64.5853),
+    'Malaysia': (4.2105, 101.9758),
+    'Peru': (-9.1900, -75.0152),
+    'Afghanistan': (33.9391, 67.7100),
+    'Venezuela': (6.4238, -66.5897),
+    'Ghana': (7.9465, -1.0232),
+    'Angola': (-11.2027, 17.8739),
+    'Nepal': (28.3949, 84.1240),
+    'Yemen': (15.5527, 48.5164),
+    'North Korea': (40.3399, 127.5101),
+    'Australia': (-25.2744, 133.7751)
+}
+
+# Coordinates as a frame indexed by country, for joining onto country data
+_COORD_DF = pd.DataFrame.from_dict(_COUNTRY_COORDS, orient='index', columns=['latitude', 'longitude'])
 
 def display_country_rankings(data: pd.DataFrame, metric_option: str, variants: list):
     """
@@ -70,27 +88,29 @@ def display_country_rankings(data: pd.DataFrame, metric_option: str, variants: l
     variants: List of variant dictionaries
     """
     if metric_option == 'Total Cases':
-        # Sort by total active cases
-        sorted_data = data.sort_values('active_cases', ascending=False)
+        # Select the top 10 countries by active cases
+        top_data = data.nlargest(10, 'active_cases')
         
         # Display top 10 countries
-        for idx, row in sorted_data.head(10).iterrows():
+        rows = top_data[['country', 'active_cases', 'infection_rate']].itertuples(index=False, name=None)
+        for country, active_cases, infection_rate in rows:
             st.metric(
-                row['country'],
-                f"{row['active_cases']:,} cases",
-                delta=f"Rate: {row['infection_rate']:.2%}"
+                country,
+                f"{active_cases:,} cases",
+                delta=f"Rate: {infection_rate:.2%}"
             )
     
     elif metric_option == 'Severity Index':
-        # Sort by severity index
-        sorted_data = data.sort_values('severity_index', ascending=False)
+        # Select the top 10 countries by severity index
+        top_data = data.nlargest(10, 'severity_index')
         
         # Display top 10 countries
-        for idx, row in sorted_data.head(10).iterrows():
+        rows = top_data[['country', 'severity_index', 'active_cases']].itertuples(index=False, name=None)
+        for country, severity_index, active_cases in rows:
             st.metric(
-                row['country'],
-                f"Severity: {row['severity_index']:.2f}",
-                delta=f"Cases: {row['active_cases']:,}"
+                country,
+                f"Severity: {severity_index:.2f}",
+                delta=f"Cases: {active_cases:,}"
             )
     
     elif metric_option == 'Variant Distribution':
@@ -103,17 +123,20 @@ def display_country_rankings(data: pd.DataFrame, metric_option: str, variants: l
         
         for tab, variant in zip(tabs, variants):
             with tab:
-                # Sort by variant-specific cases
-                variant_col = f"{variant['name']}_cases"
-                sorted_data = data.sort_values(variant_col, ascending=False)
+                # Select the top 10 countries by variant-specific cases
+                variant_col = variant['_cases_col']
+                top_data = data.nlargest(10, variant_col)
                 
                 # Display top 10 countries for this variant
-                for idx, row in sorted_data.head(10).iterrows():
-                    variant_percentage = (row[variant_col] / row['active_cases'] * 100 
-                                       if row['active_cases'] > 0 else 0)
+                variant_cases = top_data[variant_col].to_numpy()
+                active_cases = top_data['active_cases'].to_numpy()
+                variant_percentages = np.divide(
+                    variant_cases, active_cases, out=np.zeros(len(top_data)), where=active_cases > 0
+                ) * 100
+                for country, cases, variant_percentage in zip(top_data['country'], variant_cases, variant_percentages):
                     st.metric(
-                        row['country'],
-                        f"{row[variant_col]:,} cases",
+                        country,
+                        f"{cases:,} cases",
                         delta=f"{variant_percentage:.1f}% of total"
                     )
                 
@@ -129,15 +152,15 @@ def display_country_rankings(data: pd.DataFrame, metric_option: str, variants: l
                         st.write(f"Vaccine Effectiveness: {variant['vaccine_effectiveness']}%")
 
     # Add download button for full data
-    csv = convert_to_downloadable_csv(data, metric_option, variants)
+    # The CSV is only generated when the button is clicked
     st.download_button(
         label="Download Full Rankings",
-        data=csv,
+        data=lambda: convert_to_downloadable_csv(data, metric_option, variants),
         file_name=f"country_rankings_{metric_option.lower().replace(' ', '_')}.csv",
         mime="text/csv"
     )
 
-def convert_to_downloadable_csv(data: pd.DataFrame, metric_option: str, variants: list) -> str:
+def convert_to_downloadable_csv(data: pd.DataFrame, metric_option: str, variants: list) -> bytes:
     """
     Convert the ranking data to a downloadable CSV format
     
@@ -149,7 +172,7 @@ def convert_to_downloadable_csv(data: pd.DataFrame, metric_option: str, variants
     
     Returns:
     --------
-    str: CSV string of the data
+    bytes: Encoded CSV of the data
     """
     # Select relevant columns based on metric
     if metric_option == 'Total Cases':
@@ -157,7 +180,7 @@ def convert_to_downloadable_csv(data: pd.DataFrame, metric_option: str, variants
     elif metric_option == 'Severity Index':
         cols = ['country', 'severity_index', 'active_cases', 'infection_rate']
     elif metric_option == 'Variant Distribution':
-        variant_cols = [f"{v['name']}_cases" for v in variants]
+        variant_cols = [v['_cases_col'] for v in variants]
         cols = ['country', 'active_cases', 'infection_rate', 'severity_index'] + variant_cols
     
     # Create export dataframe
@@ -169,11 +192,22 @@ def convert_to_downloadable_csv(data: pd.DataFrame, metric_option: str, variants
     elif metric_option == 'Severity Index':
         export_df = export_df.sort_values('severity_index', ascending=False)
     elif metric_option == 'Variant Distribution' and variants:
-        export_df = export_df.sort_values(f"{variants[0]['name']}_cases", ascending=False)
+        export_df = export_df.sort_values(variants[0]['_cases_col'], ascending=False)
     
-    return export_df.to_csv(index=False)
+    return export_df.to_csv(index=False).encode()
+
+def _variant_arrays(variants: list) -> dict:
+    """Gather variant fields into one NumPy array per field"""
+    fields = ('daily_cases', 'severity', 'mortality_rate', 'recovery_rate', 'vaccine_effectiveness')
+    return {field: np.array([v[field] for v in variants], dtype=np.float64) for field in fields}
 
-def calculate_variant_impact(variants: list, base_transmission: float) -> float:
+def _variant_prevalence(variant_arrays: dict) -> np.ndarray:
+    """Share of total daily cases belonging to each variant"""
+    daily_cases = variant_arrays['daily_cases']
+    total_cases = daily_cases.sum()
+    return daily_cases / total_cases if total_cases > 0 else np.zeros_like(daily_cases)
+
+def calculate_variant_impact(variant_arrays: dict, base_transmission: float) -> float:
     """
     Calculate the combined impact of all variants on transmission
     
@@ -187,31 +221,24 @@ def calculate_variant_impact(variants: list, base_transmission: float) -> float:
     
     Final Transmission = Base_Rate * (1 + Combined_Impact)
     """
-    if not variants:
+    if not variant_arrays['daily_cases'].size:
         return base_transmission
     
-    total_impact = 0
-    total_cases = sum(v['daily_cases'] for v in variants)
+    # Calculate each variant's individual impact
+    variant_impact = (
+        (variant_arrays['daily_cases'] / 1000) *  # Normalized case rate
+        (variant_arrays['severity'] / 10) *        # Normalized severity
+        (variant_arrays['mortality_rate'] / 100) * # Mortality contribution
+        (1 - variant_arrays['recovery_rate'] / 100) # Recovery rate impact
+    )
     
-    for variant in variants:
-        # Calculate relative prevalence of this variant
-        prevalence = variant['daily_cases'] / total_cases if total_cases > 0 else 0
-        
-        # Calculate variant's individual impact
-        variant_impact = (
-            (variant['daily_cases'] / 1000) *  # Normalized case rate
-            (variant['severity'] / 10) *        # Normalized severity
-            (variant['mortality_rate'] / 100) * # Mortality contribution
-            (1 - variant['recovery_rate'] / 100) # Recovery rate impact
-        )
-        
-        # Add weighted impact to total
-        total_impact += variant_impact * prevalence
+    # Weight impacts by prevalence
+    total_impact = float(np.dot(variant_impact, _variant_prevalence(variant_arrays)))
     
     # Return adjusted transmission rate
     return base_transmission * (1 + total_impact)
 
-def calculate_vaccine_effectiveness(variants: list, vaccination_params: dict) -> float:
+def calculate_vaccine_effectiveness(variant_arrays: dict, vaccination_params: dict) -> float:
     """
     Calculate overall vaccine effectiveness considering variants
     
@@ -222,134 +249,34 @@ def calculate_vaccine_effectiveness(variants: list, vaccination_params: dict) ->
     
     Overall_Effectiveness = Σ(Effectiveness_i * Variant_Prevalence_i)
     """
-    if not variants or not vaccination_params['vaccines']:
+    if not variant_arrays['daily_cases'].size or not vaccination_params['name']:
         return 0
     
-    total_effectiveness = 0
-    total_cases = sum(v['daily_cases'] for v in variants)
-    
-    for variant in variants:
-        # Calculate variant's prevalence
-        prevalence = variant['daily_cases'] / total_cases if total_cases > 0 else 0
-        
-        # Average vaccine effectiveness against this variant
-        variant_vaccine_effectiveness = variant['vaccine_effectiveness'] / 100
-        
-        total_effectiveness += variant_vaccine_effectiveness * prevalence
-    
-    return total_effectiveness
-
-def calculate_global_spread(params: dict, countries_data: pd.DataFrame, variants: list = None, vaccination_params: dict = None):
-    """
-    Calculate disease spread across different countries based on parameters
-    
-    Mathematical Model:
-    ------------------
-    Risk Score = w1*PD + w2*AQ + w3*WQ + w4*HC
-    where:
-    - PD = Normalized Population Density
-    - AQ = Normalized Air Quality Impact
-    - WQ = Normalized Water Quality Impact
-    - HC = Normalized Health Conditions
-    
-    Variant-Adjusted Transmission = Base_Rate * Variant_Impact
-    
-    Final Infection Rate = Risk_Score * Adjusted_Transmission * (1 - Vaccine_Protection)
-    """
-    # Calculate base risk factors
-    countries_data['risk_score'] = (
-        0.3 * (countries_data['population_density'] / countries_data['population_density'].max()) +
-        0.2 * (countries_data['air_quality_index'] / countries_data['air_quality_index'].max()) +
-        0.2 * (countries_data['water_quality_index'] / countries_data['water_quality_index'].max()) +
-        0.3 * (countries_data['health_conditions_percentage'] / countries_data['health_conditions_percentage'].max())
-    )
-    
-    # Calculate variant-adjusted transmission rate
-    adjusted_transmission = calculate_variant_impact(variants, params['transmission_rate'])
-    
-    # Calculate vaccine effectiveness
-    vaccine_protection = calculate_vaccine_effectiveness(variants, vaccination_params)
-    
-    # Calculate infection rate with all factors
-    countries_data['infection_rate'] = (
-        countries_data['risk_score'] * 
-        (adjusted_transmission / 100) *
-        (1 - vaccine_protection) *
-        (1 + params['mutation_rate'] / 100)
-    )
-    
-    # Add variant-specific calculations
-    if variants:
-        for variant in variants:
-            variant_name = variant['name']
-            # Calculate variant-specific spread
-            countries_data[f'{variant_name}_cases'] = np.floor(
-                countries_data['population'] * 
-                countries_data['infection_rate'] * 
-                (variant['daily_cases'] / 1000) *
-                (variant['severity'] / 10)
-            ).astype(int)
-    
-    # Calculate total active cases
-    countries_data['active_cases'] = np.floor(
-        countries_data['population'] * 
-        countries_data['infection_rate']
-    ).astype(int)
-    
-    # Calculate severity index
-    countries_data['severity_index'] = calculate_severity_index(countries_data, variants if variants else [])
-    
-    return countries_data
-
-def calculate_severity_index(data: pd.DataFrame, variants: list) -> pd.Series:
-    """
-    Calculate severity index for each country based on variants present
-    
-    Mathematical Model:
-    ------------------
-    Severity_Index = Base_Severity * Σ(Variant_Severity_i * Prevalence_i)
-    
-    where Base_Severity is derived from:
-    - Population density impact
-    - Healthcare system capacity
-    - Existing health conditions
-    """
-    base_severity = (
-        0.4 * (data['population_density'] / data['population_density'].max()) +
-        0.3 * (data['health_conditions_percentage'] / data['health_conditions_percentage'].max()) +
-        0.3 * (data['infection_rate'])
-    )
-    
-    if not variants:
-        return base_severity
-    
-    # Add variant impact to severity
-    variant_severity = sum(
-        v['severity'] / 10 * (v['daily_cases'] / 1000)
-        for v in variants
-    )
+    # Prevalence weights sum to one, so a shared effectiveness is the average itself
+    effectiveness = variant_arrays['vaccine_effectiveness']
+    if (effectiveness == effectiveness[0]).all() and variant_arrays['daily_cases'].sum() > 0:
+        return float(effectiveness[0] / 100)
     
-    return base_severity * (1 + variant_severity)
+    # Average vaccine effectiveness weighted by variant prevalence
+    return float(np.dot(variant_arrays['vaccine_effectiveness'] / 100, _variant_prevalence(variant_arrays)))
 
 def display_global_map():
     st.header("Global Disease Spread Visualization")
     
     # Load and prepare data
-    countries_data = pd.read_csv('pathogen_simulation/data/country_data.csv')
+    countries_data = st.session_state.country_df
     variants = st.session_state.variants if 'variants' in st.session_state else []
     vaccination_params = st.session_state.vaccination_params if 'vaccination_params' in st.session_state else {}
     
-    # Add coordinates
-    coordinates = load_country_coordinates()
-    countries_data['latitude'] = countries_data['country'].map(lambda x: coordinates.get(x, (0,0))[0])
-    countries_data['longitude'] = countries_data['country'].map(lambda x: coordinates.get(x, (0,0))[1])
+    # Add coordinates with a single join, defaulting unknown countries to (0, 0)
+    countries_data = countries_data.join(_COORD_DF, on='country').fillna({'latitude': 0, 'longitude': 0})
     
-    # Calculate spread with variants
+    # Calculate spread with variants, keyed on hashable snapshots of the inputs
     spread_data = calculate_global_spread(
         st.session_state.pathogen_params,
         countries_data,
-        variants,
-        vaccination_params
+        tuple(tuple(sorted(v.items())) for v in variants),
+        tuple((field, tuple(values)) for field, values in vaccination_params.items())
     )
     
     # Create visualization
@@ -375,12 +302,14 @@ def display_variant_params():
                     st.write(f"**{variant['name']}**")
                 with col2:
                     if st.button(f"Remove", key=f"remove_{idx}"):
-                        st.session_state.variants.pop(idx)
+                        removed = st.session_state.variants.pop(idx)
+                        st.session_state.variant_names.discard(removed['name'])
                         st.rerun()
 
         # Option to reset all variants
         if st.session_state.variants and st.button("Remove All Variants"):
             st.session_state.variants = []
+            st.session_state.variant_names = set()
             st.rerun()
         
         # Add new variant option
@@ -394,11 +323,14 @@ def display_variant_params():
                 'vaccine_effectiveness': st.number_input("Vaccine Effectiveness (%)", 0.0, 100.0, step=0.1)
             }
             if st.button("Add Variant"):
-                if not any(v['name'] == variant['name'] for v in st.session_state.variants):
+                if variant['name'] not in st.session_state.variant_names:
+                    # Name the variant's case column once instead of on every render
+                    variant['_cases_col'] = f"{variant['name']}_cases"
                     st.session_state.variants.append(variant)
+                    st.session_state.variant_names.add(variant['name'])
                     st.rerun()
 
-def calculate_severity_index(data: pd.DataFrame, variants: list) -> pd.Series:
+def calculate_severity_index(data: pd.DataFrame, variant_arrays: dict, maxes: np.ndarray = None) -> pd.Series:
     """
     Calculate severity index for each country based on variants present
     
@@ -410,22 +342,25 @@ def calculate_severity_index(data: pd.DataFrame, variants: list) -> pd.Series:
     PD = Normalized Population Density
     HC = Normalized Health Conditions
     IR = Infection Rate
+    
+    maxes holds the column maxima of _RISK_COLUMNS when the caller already has them.
     """
-    # Calculate base severity (0-1 scale)
-    base_severity = (
-        0.4 * (data['population_density'] / data['population_density'].max()) +
-        0.3 * (data['health_conditions_percentage'] / 100) +
-        0.3 * data['infection_rate']
-    ).clip(0, 1)  # Ensure values are between 0 and 1
-    
-    if not variants:
+    if maxes is None:
+        maxes = data[_RISK_COLUMNS].max().to_numpy(dtype=np.float32)
+    
+    # Calculate base severity (0-1 scale) as one weighted sum over the scaled columns
+    severity_factors = data[_SEVERITY_COLUMNS].to_numpy(dtype=np.float32)
+    scale = np.array([maxes[0], 100, 1], dtype=np.float32)
+    base_severity = pd.Series(
+        np.clip((severity_factors / scale) @ _SEVERITY_WEIGHTS, 0, 1),  # Ensure values are between 0 and 1
+        index=data.index
+    )
+    
+    if not variant_arrays['daily_cases'].size:
         return base_severity * 10  # Scale to 0-10 range
     
     # Calculate variant impact (additive)
-    variant_impact = sum(
-        (v['severity'] / 10) * (v['daily_cases'] / 1000)
-        for v in variants
-    )
+    variant_impact = float(np.dot(variant_arrays['severity'] / 10, variant_arrays['daily_cases'] / 1000))
     
     # Combine base severity with variant impact
     final_severity = (base_severity * (1 + variant_impact)).clip(0, 1)
@@ -433,117 +368,152 @@ def calculate_severity_index(data: pd.DataFrame, variants: list) -> pd.Series:
     # Scale to 0-10 range for better visualization
     return final_severity * 10
 
-def create_map_visualization(data: pd.DataFrame, variants: list):
-    """Create the map visualization with variant-specific data"""
-    # Ensure severity_index is properly formatted for display
-    data['severity_index'] = data['severity_index'].round(2)
-    
-    # Prepare hover data dictionary
-    hover_data = {
-        'active_cases': True,
-        'infection_rate': ':.2%',
-        'severity_index': ':.2f',
-        'latitude': False,
-        'longitude': False
-    }
-    
-    # Add variant-specific cases to hover data if variants exist
-    if variants:
-        for variant in variants:
-            hover_data[f'{variant["name"]}_cases'] = True
-    
-    # Create the scatter mapbox
-    fig = px.scatter_mapbox(
-        data_frame=data,
-        lat='latitude',
-        lon='longitude',
-        size='active_cases',
-        color='severity_index',
-        hover_name='country',
-        hover_data=hover_data,
-        color_continuous_scale='RdYlBu_r',
-        size_max=50,
-        zoom=1,
-        title='Global Disease Spread with Variant Impact',
-        mapbox_style='carto-positron'
+@st.cache_resource(show_spinner=False)
+def _base_fig() -> go.Figure:
+    """Build the static map layout and marker styling once per process"""
+    fig = go.Figure(
+        go.Scattermap(
+            mode='markers',
+            marker=dict(coloraxis='coloraxis', sizemode='area'),
+            # Hover template for better formatting
+            hovertemplate=(
+                "<b>%{hovertext}</b><br>" +
+                "Active Cases: %{customdata[0]:,.0f}<br>" +
+                "Infection Rate: %{customdata[1]:.2%}<br>" +
+                "Severity Index: %{customdata[2]:.1f}/10<br>" +
+                "<extra></extra>"
+            )
+        )
     )
-    
-    # Update layout
     fig.update_layout(
+        title='Global Disease Spread with Variant Impact',
+        map=dict(style='carto-positron', zoom=1),
         height=600,
         margin={"r": 0, "t": 30, "l": 0, "b": 0},
-        coloraxis_colorbar=dict(
-            title="Severity Index (0-10)",
-            tickformat=".1f"
+        coloraxis=dict(
+            colorscale='RdYlBu_r',
+            colorbar=dict(
+                title="Severity Index (0-10)",
+                tickformat=".1f"
+            )
         ),
         showlegend=False
     )
+    return fig
+
+def _update_traces(fig: go.Figure, data: pd.DataFrame, variants: list) -> go.Figure:
+    """Fill the map markers with this run's country data"""
+    active_cases = data['active_cases'].to_numpy()
+    
+    # Hover columns, with variant-specific cases appended if variants exist
+    hover_columns = ['active_cases', 'infection_rate', 'severity_index'] + [v['_cases_col'] for v in variants]
     
-    # Update hover template for better formatting
     fig.update_traces(
-        hovertemplate=(
-            "<b>%{hovertext}</b><br>" +
-            "Active Cases: %{customdata[0]:,.0f}<br>" +
-            "Infection Rate: %{customdata[1]:.2%}<br>" +
-            "Severity Index: %{customdata[2]:.1f}/10<br>" +
-            "<extra></extra>"
+        lat=data['latitude'],
+        lon=data['longitude'],
+        hovertext=data['country'],
+        customdata=data[hover_columns].to_numpy(),
+        marker=dict(
+            size=active_cases,
+            sizeref=max(active_cases.max(initial=0), 1) / _MAP_SIZE_MAX ** 2,
+            color=data['severity_index']
         )
     )
-    
+    # Center the map over the plotted countries
+    fig.update_layout(
+        map_center=dict(lat=data['latitude'].mean(), lon=data['longitude'].mean())
+    )
     return fig
 
-def calculate_global_spread(params: dict, countries_data: pd.DataFrame, variants: list = None, vaccination_params: dict = None):
+def create_map_visualization(data: pd.DataFrame, variants: list):
+    """Create the map visualization with variant-specific data"""
+    # Ensure severity_index is properly formatted for display
+    data['severity_index'] = data['severity_index'].round(2)
+    
+    # Clone the cached scaffolding so only the trace data is rebuilt
+    return _update_traces(go.Figure(_base_fig()), data, variants)
+
+def _apply_spread_kernel(countries_data: pd.DataFrame, variants: list, variant_arrays: dict, risk_factors: np.ndarray,
+                         maxes: np.ndarray, transmission_factor: float) -> pd.DataFrame:
+    """Compute the spread columns of a large country table with spread_kernel"""
+    coeffs = (variant_arrays['daily_cases'] / 1000) * (variant_arrays['severity'] / 10)
+    variant_impact = float(np.dot(variant_arrays['severity'] / 10, variant_arrays['daily_cases'] / 1000))
+    
+    risk, infection, active_cases, variant_cases, severity = spread_kernel(
+        *risk_factors.T,
+        countries_data['population'].to_numpy(dtype=np.int64),
+        maxes,
+        coeffs,
+        transmission_factor,
+        variant_impact
+    )
+    
+    new_cols = {'risk_score': risk, 'infection_rate': infection}
+    new_cols.update(zip((v['_cases_col'] for v in variants), variant_cases.T))
+    new_cols['active_cases'] = active_cases
+    new_cols['severity_index'] = severity
+    return countries_data.assign(**new_cols)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def calculate_global_spread(params: PathogenParams, countries_data: pd.DataFrame, variants_key: tuple = (), vaccination_key: tuple = ()):
     """Calculate disease spread across different countries"""
-    # Create a copy of the dataframe to avoid modifications to original
-    data = countries_data.copy()
+    variants = [dict(v) for v in variants_key]
+    vaccination_params = {field: list(values) for field, values in vaccination_key}
     
-    # Calculate base risk factors
-    data['risk_score'] = (
-        0.3 * (data['population_density'] / data['population_density'].max()) +
-        0.2 * (data['air_quality_index'] / data['air_quality_index'].max()) +
-        0.2 * (data['water_quality_index'] / data['water_quality_index'].max()) +
-        0.3 * (data['health_conditions_percentage'] / data['health_conditions_percentage'].max())
-    ).clip(0, 1)
+    # Variant fields as arrays, shared by the helpers below
+    variant_arrays = _variant_arrays(variants or [])
     
     # Calculate variant-adjusted transmission rate
     if variants:
-        adjusted_transmission = calculate_variant_impact(variants, params['transmission_rate'])
+        adjusted_transmission = calculate_variant_impact(variant_arrays, params.transmission_rate)
     else:
-        adjusted_transmission = params['transmission_rate']
+        adjusted_transmission = params.transmission_rate
     
     # Calculate vaccine effectiveness
     if vaccination_params and variants:
-        vaccine_protection = calculate_vaccine_effectiveness(variants, vaccination_params)
+        vaccine_protection = calculate_vaccine_effectiveness(variant_arrays, vaccination_params)
     else:
         vaccine_protection = 0
     
-    # Calculate infection rate
-    data['infection_rate'] = (
-        data['risk_score'] * 
-        (adjusted_transmission / 100) *
-        (1 - vaccine_protection) *
-        (1 + params['mutation_rate'] / 100)
-    ).clip(0, 1)  # Ensure rate is between 0 and 1
+    # Fold every scalar factor of the infection rate into one multiplier
+    transmission_factor = (adjusted_transmission / 100) * (1 - vaccine_protection) * (1 + params.mutation_rate / 100)
+    
+    # Column maxima normalize both the risk and severity inputs; reduce them once
+    risk_factors = countries_data[_RISK_COLUMNS].to_numpy(dtype=np.float32)
+    maxes = risk_factors.max(axis=0)
+    
+    # Large tables go through the row-parallel kernel when numba is available
+    if HAVE_NUMBA and len(countries_data) >= _KERNEL_MIN_ROWS:
+        return _apply_spread_kernel(
+            countries_data, variants, variant_arrays, risk_factors, maxes, transmission_factor
+        )
+    
+    # Derived columns are gathered here and attached with one assign, which
+    # leaves the caller's frame untouched without deep-copying it
+    new_cols = {}
+    
+    # Calculate base risk factors from all normalized columns in one pass
+    risk_score = np.clip((risk_factors / maxes) @ _RISK_WEIGHTS, 0, 1)
+    new_cols['risk_score'] = risk_score
     
-    # Calculate variant-specific cases if variants exist
+    # Calculate infection rate in a single multiply, clipped in place
+    infection_rate = risk_score * transmission_factor
+    np.clip(infection_rate, 0, 1, out=infection_rate)  # Ensure rate is between 0 and 1
+    new_cols['infection_rate'] = infection_rate
+    
+    # Calculate variant-specific cases for all variants in one outer product
+    base_cases = countries_data['population'].to_numpy() * infection_rate
     if variants:
-        for variant in variants:
-            variant_name = variant['name']
-            data[f'{variant_name}_cases'] = np.floor(
-                data['population'] * 
-                data['infection_rate'] * 
-                (variant['daily_cases'] / 1000) *
-                (variant['severity'] / 10)
-            ).astype(int)
-    
-    # Calculate total active cases
-    data['active_cases'] = np.floor(
-        data['population'] * 
-        data['infection_rate']
-    ).astype(int)
+        coeffs = (variant_arrays['daily_cases'] / 1000) * (variant_arrays['severity'] / 10)
+        variant_cases = (base_cases[:, None] * coeffs).astype(np.int64)
+        new_cols.update(zip((v['_cases_col'] for v in variants), variant_cases.T))
+    
+    # Calculate total active cases (cases are non-negative, so truncation is floor)
+    new_cols['active_cases'] = base_cases.astype(np.int64)
+    data = countries_data.assign(**new_cols)
     
     # Calculate severity index
-    data['severity_index'] = calculate_severity_index(data, variants if variants else [])
+    data['severity_index'] = calculate_severity_index(data, variant_arrays, maxes)
     
     return data
 
@@ -552,9 +522,10 @@ def display_variant_analysis(data: pd.DataFrame, variants: list):
     st.subheader("Variant Analysis")
     
     if variants:
-        for variant in variants:
+        # Total every variant's cases in one column-wise reduction
+        totals = data[[v['_cases_col'] for v in variants]].sum().to_numpy()
+        for variant, total_variant_cases in zip(variants, totals):
             st.write(f"**{variant['name']} Impact**")
-            total_variant_cases = data[f'{variant["name"]}_cases'].sum()
             st.metric(
                 "Total Cases",
                 f"{total_variant_cases:,}",